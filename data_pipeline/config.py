@@ -7,9 +7,71 @@ adjustments easier without modifying core business logic.
 """
 
 import os
+import re
+import warnings
 from pathlib import Path
 from typing import Dict, List
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator - see requirements.txt
+    hyperscan = None
+
+try:
+    import regex
+except ImportError:  # Optional accelerator - see requirements.txt
+    regex = None
+
+# Engine for the exact-span PII regexes. Without Hyperscan every region runs
+# through these, so prefer the `regex` package when it is installed: its
+# matcher can release the GIL (concurrent=True) and is faster on long,
+# noisy OCR strings. Its default VERSION0 syntax is re-compatible.
+_PII_REGEX_ENGINE = regex if (hyperscan is None and regex is not None) else re
+
+
+# Vietnamese letter classes shared by the name pattern. Factored out so the
+# long diacritic classes are written once instead of being inlined per word.
+_VN_UPPER = "[A-ZÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ]"
+_VN_LOWER = "[a-zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]"
+# One capitalised name word, e.g. "Nguyễn"
+_VN_NAME_WORD = _VN_UPPER + _VN_LOWER + "+"
+
+
+def _compile_hyperscan_db(patterns: Dict[str, str]):
+    """
+    Compile all PII patterns into one Hyperscan block-mode database.
+    
+    Args:
+        patterns: PII type -> regex string; the pattern id is its insertion index
+        
+    Returns:
+        Compiled hyperscan.Database, or None if Hyperscan is unavailable
+        
+    Why: Hyperscan runs every pattern simultaneously in a single SIMD pass
+    over the text. SINGLEMATCH makes it report each pattern at most once,
+    which is all the detector needs to know which patterns to run with re.
+    """
+    if hyperscan is None:
+        return None
+        
+    flags = (
+        hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP |
+        hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=[pattern.encode('utf-8') for pattern in patterns.values()],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns)
+        )
+    except hyperscan.error as e:
+        warnings.warn(f"Hyperscan could not compile PII patterns, using re only: {e}")
+        return None
+        
+    return db
+
 
 class PipelineConfig:
     """
@@ -22,6 +84,7 @@ class PipelineConfig:
     # Project Paths
     BASE_DIR = Path(__file__).resolve().parent
     DATASET_DIR = BASE_DIR.parent / "dataset" / "raw"
+    REDACTED_DIR = DATASET_DIR / "redacted"
     
     # Document Generation Settings
     TARGET_PDF_COUNT = 30
@@ -55,6 +118,12 @@ class PipelineConfig:
     # OCR Settings
     OCR_LANGUAGES = ['vi', 'en']  # Vietnamese and English
     OCR_GPU = False  # Set to True if CUDA is available
+    OCR_BATCH_SIZE = 8  # PDF pages per EasyOCR batched call
+    PDF_RENDER_DPI = 300  # Resolution of redacted PDF pages written to disk
+    OCR_DPI = 200  # PDF pages are OCR'd at this lower resolution
+    # Laplacian variance (on a 400x400 thumbnail) above which an image counts
+    # as clean and skips OCR preprocessing
+    OCR_SHARPNESS_THRESHOLD = 1000.0
     
     # PII Detection Patterns (Vietnamese specific)
     PII_PATTERNS: Dict[str, str] = {
@@ -67,7 +136,10 @@ class PipelineConfig:
         
         # Names after common prefixes in Vietnamese contracts
         # Captures names following "Ông/Bà:", "Bên A:", "Bên B:", "Họ và tên:"
-        "name": r'(?:Ông/Bà|Bên\s+[AB]|Họ\s+và\s+tên)\s*:\s*([A-ZÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ][a-zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]+(?:\s+[A-ZÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ][a-zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]+){1,3})',
+        "name": (
+            r'(?:Ông/Bà|Bên\s+[AB]|Họ\s+và\s+tên)\s*:\s*'
+            rf'({_VN_NAME_WORD}(?:\s+{_VN_NAME_WORD}){{1,3}})'
+        ),
         
         # Phone numbers: Vietnamese format (10-11 digits)
         "phone": r'\b0\d{9,10}\b',
@@ -76,18 +148,78 @@ class PipelineConfig:
         "address": r'(?:Địa\s+chỉ|Nơi\s+ở)\s*:\s*(.{10,100})',
     }
     
+    # Compiled once at import so the per-page detection loop never pays
+    # re.compile (or an re-cache lookup) for the large name pattern.
+    PII_PATTERNS_COMPILED: Dict[str, re.Pattern] = {
+        pii_type: _PII_REGEX_ENGINE.compile(
+            pattern, _PII_REGEX_ENGINE.IGNORECASE | _PII_REGEX_ENGINE.UNICODE
+        )
+        for pii_type, pattern in PII_PATTERNS.items()
+    }
+    # finditer() keyword arguments for the engine above
+    PII_FINDITER_KWARGS: Dict[str, bool] = (
+        {"concurrent": True} if _PII_REGEX_ENGINE is not re else {}
+    )
+    
+    # Cheap literal prerequisites checked before running a type's regex.
+    # Keyword triggers are matched against the lower-cased OCR text; every
+    # pattern in PII_DIGIT_TYPES needs at least one digit to match at all.
+    PII_KEYWORD_TRIGGERS: Dict[str, List[str]] = {
+        "name": ["ông/bà", "bên", "họ"],
+        "address": ["địa", "nơi"],
+    }
+    PII_DIGIT_TYPES = frozenset({"cccd", "dob", "phone"})
+    # Shortest text each pattern can match (e.g. "1/1/1960" for dob,
+    # "Bên A:Ab Cd" for name); shorter OCR regions skip that pattern.
+    PII_MIN_LENGTHS: Dict[str, int] = {
+        "cccd": 12,
+        "dob": 8,
+        "name": 11,
+        "phone": 10,
+        "address": 16,
+    }
+    PII_MIN_TEXT_LENGTH = min(PII_MIN_LENGTHS.values())
+    
+    # Label order of the fused screen below (mirrors PII_PATTERNS insertion order).
+    PII_LABELS: List[str] = list(PII_PATTERNS.keys())
+    
+    # All PII patterns fused into one alternation. A single search() over an OCR
+    # region tells us whether ANY pattern can match; most regions contain no PII,
+    # so they are rejected in one pass instead of one pass per pattern.
+    PII_SCREEN_PATTERN: re.Pattern = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in PII_PATTERNS.values()),
+        re.IGNORECASE | re.UNICODE
+    )
+    
+    # Same patterns as one Hyperscan database (None when Hyperscan is not
+    # installed). Pattern ids index into PII_LABELS.
+    PII_HS_DB = _compile_hyperscan_db(PII_PATTERNS)
+    
+    # Pages of one document scanned concurrently. Only used when the scanning
+    # engine (Hyperscan or `regex` with concurrent=True) releases the GIL;
+    # plain re holds it, so threads would only add overhead.
+    PII_DETECTION_THREADS = 4
+    PII_PARALLEL_PAGES = PII_HS_DB is not None or _PII_REGEX_ENGINE is not re
+    # Distinct OCR region texts whose screening result each detector remembers
+    PII_SCREEN_CACHE_SIZE = 16384
+    
     # Redaction Settings
     REDACTION_COLOR = (0, 0, 0)  # Black boxes
-    REDACTION_THICKNESS = -1  # Filled rectangle
     REDACTION_PADDING = 5  # pixels - extra padding around detected text
+    REDACTION_PNG_COMPRESSION = 1  # zlib level 0-9; low trades file size for encode speed
+    REDACTION_WRITER_THREADS = 4  # Concurrent PNG encode+write per redactor; also caps pages awaiting write
+    REDACTION_RENDER_AHEAD = 2  # PDF pages rendered ahead of the page being redacted
     
     # Logging Settings
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "json"  # json or text
     LOG_FILE = BASE_DIR / "pipeline.log"
+    LOG_FILE_BUFFER_SIZE = 64 * 1024  # bytes buffered before a write() to LOG_FILE
+    # Keep 1 in N DEBUG records (1 = keep all); INFO and above are never sampled
+    LOG_DEBUG_SAMPLE_N = 1
     
     # Performance Settings
-    MAX_CONCURRENT_TASKS = 5  # For async operations
+    MAX_CONCURRENT_TASKS = 5  # Worker processes for the processing phase
     
     @classmethod
     def ensure_directories(cls) -> None:
@@ -98,6 +230,7 @@ class PipelineConfig:
         to non-existent directories. Should be called during pipeline initialization.
         """
         cls.DATASET_DIR.mkdir(parents=True, exist_ok=True)
+        cls.REDACTED_DIR.mkdir(parents=True, exist_ok=True)
         
     @classmethod
     def get_output_path(cls, filename: str) -> Path:
@@ -9,18 +9,23 @@ processing details. Makes the pipeline easier to understand, test, and modify.
 """
 
 import asyncio
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
 from config import PipelineConfig
-from modules.ingestion.crawler import run_crawler
 from modules.ingestion.document_generator import generate_all_documents
-from modules.processing.ocr_engine import OCREngine
-from modules.processing.pii_detector import PIIDetector
-from modules.redaction.redactor import DocumentRedactor
 from modules.storage.metadata_manager import MetadataManager
-from utils.logger import setup_logger, log_with_context
+from utils.logger import setup_logger, log_with_context, init_process_logging
+
+# Playwright, EasyOCR (torch) and the redactor are imported lazily at the point
+# of use: the crawler only when enabled, OCR/redaction only inside pool workers.
+if TYPE_CHECKING:
+    from modules.processing.ocr_engine import OCREngine
+    from modules.processing.pii_detector import PIIDetector
+    from modules.redaction.redactor import DocumentRedactor
 
 
 logger = setup_logger(__name__)
@@ -44,17 +49,16 @@ class DataPipeline:
                          synthetic docs are sufficient and more reliable.
         """
         self.skip_crawler = skip_crawler
-        self.ocr_engine: Optional[OCREngine] = None
-        self.pii_detector: Optional[PIIDetector] = None
-        self.redactor: Optional[DocumentRedactor] = None
         self.metadata_manager: Optional[MetadataManager] = None
         
     def _initialize_components(self) -> None:
         """
         Initialize all pipeline components.
         
-        Why lazy initialization: Some components (like OCR) are expensive to
-        initialize. We only create them when actually running the pipeline.
+        Why lazy initialization: Some components are expensive to initialize.
+        We only create them when actually running the pipeline. The OCR,
+        PII and redaction components live in the processing workers
+        (see _init_worker), not in this process.
         """
         logger.info("Initializing pipeline components")
         
@@ -62,9 +66,6 @@ class DataPipeline:
         PipelineConfig.ensure_directories()
         
         # Initialize components
-        self.ocr_engine = OCREngine()
-        self.pii_detector = PIIDetector()
-        self.redactor = DocumentRedactor()
         self.metadata_manager = MetadataManager()
         
         # Initialize metadata
@@ -100,6 +101,7 @@ class DataPipeline:
         if not self.skip_crawler:
             try:
                 logger.info("Starting web crawler")
+                from modules.ingestion.crawler import run_crawler
                 templates = await run_crawler()
                 log_with_context(
                     logger, 'info', 'Crawler completed',
@@ -139,7 +141,44 @@ class DataPipeline:
 
         return documents_metadata
         
-    def _run_processing(self) -> List[Dict[str, Any]]:
+    async def _process_in_pool(
+        self,
+        executor: ProcessPoolExecutor,
+        file_path: Path,
+        idx: int,
+        total: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Hand one file to the worker pool and await its result.
+        
+        Args:
+            executor: Pool running _process_one
+            file_path: Document to process
+            idx: 1-based position of the file (for progress logging)
+            total: Total number of files in this run
+            
+        Returns:
+            Processing result dictionary, or None if OCR produced no results
+        """
+        loop = asyncio.get_running_loop()
+        
+        try:
+            return await loop.run_in_executor(executor, _process_one, file_path, idx, total)
+        except Exception as e:
+            # Worker crashed outright (e.g. broken pool) - record and move on
+            log_with_context(
+                logger, 'error', 'Failed to process file',
+                filename=file_path.name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return {
+                'filename': file_path.name,
+                'success': False,
+                'error': str(e)
+            }
+            
+    async def _run_processing(self) -> List[Dict[str, Any]]:
         """
         Run the processing phase (OCR + PII detection + redaction).
         
@@ -148,129 +187,84 @@ class DataPipeline:
             
         Why: Orchestrates the core processing logic - extracting text,
         finding PII, and redacting it. Each step builds on the previous.
+        
+        Why a process pool: Every file is independent and OCR is CPU-bound,
+        so files are fanned out across worker processes. Metadata is only
+        ever touched here in the parent, in one batch once all results are in.
+        
+        Why async: Pool futures are awaited from the event loop, so OCR of
+        one file overlaps PII detection/redaction of others in sibling
+        workers while the parent collects finished results as they arrive,
+        without blocking the loop.
         """
         logger.info("=" * 60)
         logger.info("PHASE 2: OCR & PII DETECTION")
         logger.info("=" * 60)
         
         processing_results = []
+        pii_by_file: Dict[str, List] = {}
         dataset_dir = PipelineConfig.DATASET_DIR
-        
-        # Get all files in dataset directory
-        pdf_files = list(dataset_dir.glob("*.pdf"))
-        image_files = list(dataset_dir.glob("*.png")) + list(dataset_dir.glob("*.jpg"))
+        redacted_dir = PipelineConfig.REDACTED_DIR
+        
+        # Get all files in dataset directory - one directory walk, classified by suffix
+        pdf_entries: List[os.DirEntry] = []
+        image_entries: List[os.DirEntry] = []
+        with os.scandir(dataset_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                suffix = entry.name.rsplit('.', 1)[-1].lower()
+                if suffix == 'pdf':
+                    pdf_entries.append(entry)
+                elif suffix in ('png', 'jpg', 'jpeg'):
+                    image_entries.append(entry)
+                    
+        # Submission order: all PDFs as one contiguous batch, then images, each
+        # largest first. Long multi-page PDFs start while every worker is
+        # free, and the short single-image jobs fill in the tail of the pool.
+        pdf_entries.sort(key=lambda e: e.stat().st_size, reverse=True)
+        image_entries.sort(key=lambda e: e.stat().st_size, reverse=True)
+        pdf_files = [Path(e.path) for e in pdf_entries]
+        image_files = [Path(e.path) for e in image_entries]
         
         all_files = pdf_files + image_files
+        total = len(all_files)
         
         log_with_context(
             logger, 'info', 'Starting document processing',
-            total_files=len(all_files),
+            total_files=total,
             pdfs=len(pdf_files),
-            images=len(image_files)
+            images=len(image_files),
+            workers=PipelineConfig.MAX_CONCURRENT_TASKS
         )
         
-        for idx, file_path in enumerate(all_files, 1):
-            try:
-                logger.info(f"Processing file {idx}/{len(all_files)}: {file_path.name}")
+        with ProcessPoolExecutor(
+            max_workers=PipelineConfig.MAX_CONCURRENT_TASKS,
+            initializer=_init_worker,
+            initargs=(redacted_dir,)
+        ) as executor:
+            tasks = [
+                self._process_in_pool(executor, file_path, idx, total)
+                for idx, file_path in enumerate(all_files, 1)
+            ]
+            
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
                 
-                # Step 1: OCR
-                if file_path.suffix.lower() == '.pdf':
-                    ocr_results = self.ocr_engine.extract_text_from_pdf(file_path)
-                else:
-                    ocr_results = self.ocr_engine.extract_text_from_image_file(file_path)
-                    
-                if not ocr_results:
-                    logger.warning(f"No OCR results for {file_path.name}, skipping")
+                if result is None:
+                    # No OCR results - nothing to record
                     continue
                     
-                # Step 2: PII Detection
-                pii_matches = self.pii_detector.detect_in_ocr_results(ocr_results)
+                processing_results.append(result)
                 
-                pii_stats = self.pii_detector.get_pii_statistics(pii_matches)
-                log_with_context(
-                    logger, 'info', 'PII detection completed',
-                    filename=file_path.name,
-                    pii_found=len(pii_matches),
-                    pii_stats=pii_stats
-                )
-                
-                # Step 3: Redaction
-                redaction_result = self._redact_document(file_path, pii_matches)
-                
-                # Collect results
-                processing_results.append({
-                    'filename': file_path.name,
-                    'ocr_pages': len(ocr_results),
-                    'pii_matches': pii_matches,
-                    'redaction_result': redaction_result,
-                    'success': True
-                })
-                
-                # Update metadata
-                self.metadata_manager.add_pii_matches_to_document(
-                    file_path.name,
-                    pii_matches
-                )
-                
-            except Exception as e:
-                log_with_context(
-                    logger, 'error', 'Failed to process file',
-                    filename=file_path.name,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
-                
-                processing_results.append({
-                    'filename': file_path.name,
-                    'success': False,
-                    'error': str(e)
-                })
-                
-                # Continue processing other files
-                continue
-                
-        return processing_results
-        
-    def _redact_document(
-        self, 
-        file_path: Path, 
-        pii_matches: List
-    ) -> Dict[str, Any]:
-        """
-        Redact PII from a single document.
+                if result['success']:
+                    pii_by_file[result['filename']] = result['pii_matches']
+                    
+        # Update metadata once for the whole batch
+        self.metadata_manager.add_pii_matches_bulk(pii_by_file)
         
-        Args:
-            file_path: Path to document
-            pii_matches: List of detected PII matches
-            
-        Returns:
-            Redaction result dictionary
-        """
-        logger.info(f"Redacting: {file_path.name}")
+        return processing_results
         
-        try:
-            # Create redacted output directory
-            redacted_dir = PipelineConfig.DATASET_DIR / "redacted"
-            redacted_dir.mkdir(exist_ok=True)
-            
-            output_path = redacted_dir / file_path.name
-            
-            # Redact based on file type
-            if file_path.suffix.lower() == '.pdf':
-                result = self.redactor.redact_pdf(file_path, pii_matches, output_path)
-            else:
-                result = self.redactor.redact_image_file(file_path, pii_matches, output_path)
-                
-            return result
-            
-        except Exception as e:
-            log_with_context(
-                logger, 'error', 'Redaction failed',
-                filename=file_path.name,
-                error=str(e)
-            )
-            raise
-            
     def _finalize_metadata(
         self, 
         documents_metadata: List[Dict[str, Any]],
@@ -343,7 +337,7 @@ class DataPipeline:
         Raises:
             Exception: Any unhandled errors (after logging)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         logger.info("#" * 60)
         logger.info("# PII REDACTION DATA PIPELINE")
@@ -357,15 +351,15 @@ class DataPipeline:
             documents_metadata = await self._run_ingestion()
             
             # Phase 2: Processing
-            processing_results = self._run_processing()
+            processing_results = await self._run_processing()
             
             # Phase 3: Finalize
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             self._finalize_metadata(documents_metadata, processing_results, total_time)
             
             logger.info("#" * 60)
             logger.info("# PIPELINE EXECUTION COMPLETED")
-            logger.info(f"# Total Time: {total_time:.2f} seconds")
+            logger.info("# Total Time: %.2f seconds", total_time)
             logger.info("#" * 60)
             
         except KeyboardInterrupt:
@@ -380,6 +374,145 @@ class DataPipeline:
             raise
 
 
+# Per-process pipeline components, populated by _init_worker() once in
+# every pool worker so the OCR model is loaded once per process, not per file.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(redacted_dir: Path) -> None:
+    """
+    Build the processing components for one pool worker.
+    
+    Args:
+        redacted_dir: Directory redacted outputs are written to (already created)
+        
+    Why: Passed as the ProcessPoolExecutor initializer. EasyOCR model loading
+    is expensive, so each worker does it once and reuses it for every file
+    it is handed.
+    """
+    from modules.processing.ocr_engine import OCREngine
+    from modules.processing.pii_detector import PIIDetector
+    from modules.redaction.redactor import DocumentRedactor
+    
+    init_process_logging()
+    _WORKER_STATE['ocr_engine'] = OCREngine()
+    _WORKER_STATE['pii_detector'] = PIIDetector()
+    _WORKER_STATE['redactor'] = DocumentRedactor()
+    _WORKER_STATE['redacted_dir'] = redacted_dir
+
+
+def _redact_document(
+    redactor: "DocumentRedactor",
+    file_path: Path, 
+    pii_matches: List,
+    redacted_dir: Path
+) -> Dict[str, Any]:
+    """
+    Redact PII from a single document.
+    
+    Args:
+        redactor: Redactor owned by the current worker
+        file_path: Path to document
+        pii_matches: List of detected PII matches
+        redacted_dir: Output directory, resolved once by the caller
+        
+    Returns:
+        Redaction result dictionary
+    """
+    logger.info("Redacting: %s", file_path.name)
+    
+    try:
+        # redacted_dir is created once by PipelineConfig.ensure_directories()
+        output_path = redacted_dir / file_path.name
+        
+        # Redact based on file type
+        if file_path.suffix.lower() == '.pdf':
+            result = redactor.redact_pdf(file_path, pii_matches, output_path)
+        else:
+            result = redactor.redact_image_file(file_path, pii_matches, output_path)
+            
+        return result
+        
+    except Exception as e:
+        log_with_context(
+            logger, 'error', 'Redaction failed',
+            filename=file_path.name,
+            error=str(e)
+        )
+        raise
+
+
+def _process_one(file_path: Path, idx: int, total: int) -> Optional[Dict[str, Any]]:
+    """
+    OCR, PII-scan and redact a single file inside a pool worker.
+    
+    Args:
+        file_path: Document to process
+        idx: 1-based position of the file (for progress logging)
+        total: Total number of files in this run
+        
+    Returns:
+        Processing result dictionary, or None if OCR produced no results
+        
+    Why module-level: ProcessPoolExecutor pickles the callable by reference,
+    so it has to live at module scope rather than on DataPipeline.
+    """
+    ocr_engine: "OCREngine" = _WORKER_STATE['ocr_engine']
+    pii_detector: "PIIDetector" = _WORKER_STATE['pii_detector']
+    redactor: "DocumentRedactor" = _WORKER_STATE['redactor']
+    
+    try:
+        logger.info("Processing file %d/%d: %s", idx, total, file_path.name)
+        
+        # Step 1: OCR
+        if file_path.suffix.lower() == '.pdf':
+            ocr_results = ocr_engine.extract_text_from_pdf(file_path)
+        else:
+            ocr_results = ocr_engine.extract_text_from_image_file(file_path)
+            
+        if not ocr_results:
+            logger.warning("No OCR results for %s, skipping", file_path.name)
+            return None
+            
+        # Step 2: PII Detection
+        pii_matches = pii_detector.detect_in_ocr_results(ocr_results)
+        
+        pii_stats = pii_detector.get_pii_statistics(pii_matches)
+        log_with_context(
+            logger, 'info', 'PII detection completed',
+            filename=file_path.name,
+            pii_found=len(pii_matches),
+            pii_stats=pii_stats
+        )
+        
+        # Step 3: Redaction
+        redaction_result = _redact_document(
+            redactor, file_path, pii_matches, _WORKER_STATE['redacted_dir']
+        )
+        
+        return {
+            'filename': file_path.name,
+            'ocr_pages': len(ocr_results),
+            'pii_matches': pii_matches,
+            'redaction_result': redaction_result,
+            'success': True
+        }
+        
+    except Exception as e:
+        log_with_context(
+            logger, 'error', 'Failed to process file',
+            filename=file_path.name,
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        
+        return {
+            'filename': file_path.name,
+            'success': False,
+            'error': str(e)
+        }
+
+
 async def main():
     """
     Main entry point for the pipeline.
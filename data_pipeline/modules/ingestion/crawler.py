@@ -11,9 +11,9 @@ interaction patterns that reduce the risk of being blocked.
 
 import asyncio
 import random
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from pathlib import Path
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route, TimeoutError as PlaywrightTimeout
 
 from config import PipelineConfig
 from utils.logger import setup_logger, log_with_context
@@ -21,6 +21,35 @@ from utils.logger import setup_logger, log_with_context
 
 logger = setup_logger(__name__)
 
+_RESULT_SELECTOR = 'article[data-testid="result"]'
+
+# Runs in the page: collect up to n search results as [{title, url}, ...],
+# dropping results that lack a heading or a non-empty link.
+_EXTRACT_RESULTS_JS = """
+(n) => Array.from(document.querySelectorAll('article[data-testid="result"]'))
+    .slice(0, n)
+    .map(article => {
+        const heading = article.querySelector('h2');
+        const link = article.querySelector('a[href]');
+        if (!heading || !link) return null;
+        const url = (link.getAttribute('href') || '').trim();
+        return url ? {title: heading.innerText.trim(), url: url} : null;
+    })
+    .filter(Boolean)
+"""
+
+# Resource types never needed to read result titles/links. Aborting them keeps
+# page loads small and lets the DOM settle sooner.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for blocked resource types, let everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class TemplateCrawler:
     """
@@ -38,6 +67,7 @@ class TemplateCrawler:
         self.min_delay = PipelineConfig.CRAWLER_MIN_DELAY
         self.max_delay = PipelineConfig.CRAWLER_MAX_DELAY
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         
     async def _human_delay(self) -> None:
         """
@@ -71,8 +101,8 @@ class TemplateCrawler:
         Initialize browser instance.
         
         Why: Separating initialization from __init__ allows for proper async setup
-        and makes resource management more explicit. The browser instance is
-        expensive to create, so we want to reuse it across multiple crawls.
+        and makes resource management more explicit. The browser instance and
+        its context are expensive to create, so we reuse them across all queries.
         """
         logger.info("Initializing Playwright browser")
         playwright = await async_playwright().start()
@@ -96,6 +126,14 @@ class TemplateCrawler:
                 '--no-sandbox',
             ]
         )
+        
+        # One shared context for every query: each search only opens a page.
+        self.context = await self.browser.new_context(
+            user_agent=self.user_agent,
+            viewport={'width': 1280, 'height': 720},
+            locale='vi-VN',  # Vietnamese locale
+        )
+        await self.context.route("**/*", _block_heavy_resources)
         logger.info("Browser initialized successfully")
         
     async def cleanup(self) -> None:
@@ -105,6 +143,9 @@ class TemplateCrawler:
         Why: Proper resource cleanup prevents memory leaks and zombie processes.
         Always call this in a finally block or use async context managers.
         """
+        if self.context:
+            await self.context.close()
+            
         if self.browser:
             logger.info("Closing browser")
             await self.browser.close()
@@ -128,65 +169,55 @@ class TemplateCrawler:
             RuntimeError: If browser is not initialized
             Exception: For any crawling errors (logged but not raised)
         """
-        if not self.browser:
+        if not self.browser or not self.context:
             raise RuntimeError("Browser not initialized. Call initialize() first.")
             
         results = []
         
         try:
-            logger.info(f"Searching for templates: {query}")
-            context = await self.browser.new_context(
-                user_agent=self.user_agent,
-                viewport={'width': 1280, 'height': 720},
-                locale='vi-VN',  # Vietnamese locale
-            )
+            logger.info("Searching for templates: %s", query)
+            page = await self.context.new_page()
             
-            page = await context.new_page()
+            # Random stagger before navigating. Queries run concurrently, so this
+            # replaces the old sequential between-query delay: requests still
+            # reach the search engine at irregular, human-like intervals.
+            await page.wait_for_timeout(
+                random.uniform(self.min_delay, self.max_delay) * 1000
+            )
             
             # Navigate to search engine (using DuckDuckGo for simplicity)
             search_url = f"https://duckduckgo.com/?q={query.replace(' ', '+')}"
-            await page.goto(search_url, wait_until='networkidle')
+            # Only the DOM is needed; wait for the result nodes themselves
+            # rather than for every network request to go idle.
+            await page.goto(search_url, wait_until='domcontentloaded')
             
             await self._human_delay()
-            await self._random_mouse_movement(page)
+            # Mouse trails only matter to a rendered, observable browser; in
+            # headless mode this would just be a wasted CDP round-trip.
+            if not self.headless:
+                await self._random_mouse_movement(page)
             
             # Extract search results
             # Note: In production, you'd want more sophisticated selectors
             # and error handling for different search engine layouts
             try:
-                result_elements = await page.query_selector_all('article[data-testid="result"]')
+                await page.wait_for_selector(_RESULT_SELECTOR)
                 
-                for i, element in enumerate(result_elements[:max_results]):
-                    try:
-                        # Extract title and URL
-                        title_elem = await element.query_selector('h2')
-                        link_elem = await element.query_selector('a[href]')
-                        
-                        if title_elem and link_elem:
-                            title = await title_elem.inner_text()
-                            url = await link_elem.get_attribute('href')
-                            
-                            if url:
-                                results.append({
-                                    'title': title.strip(),
-                                    'url': url.strip()
-                                })
-                                log_with_context(
-                                    logger, 'debug', 'Found template result',
-                                    title=title.strip(), url=url.strip()
-                                )
-                    except Exception as elem_error:
-                        # Log but continue - some results might be malformed
-                        log_with_context(
-                            logger, 'warning', 'Failed to parse search result element',
-                            error=str(elem_error), index=i
-                        )
-                        continue
+                # One CDP round-trip: the selector walk and text/href extraction
+                # run inside the page and come back as a JSON list.
+                extracted = await page.evaluate(_EXTRACT_RESULTS_JS, max_results)
+                
+                for item in extracted:
+                    results.append(item)
+                    log_with_context(
+                        logger, 'debug', 'Found template result',
+                        title=item['title'], url=item['url']
+                    )
                         
             except PlaywrightTimeout:
-                logger.warning(f"Timeout waiting for search results for query: {query}")
+                logger.warning("Timeout waiting for search results for query: %s", query)
                 
-            await context.close()
+            await page.close()
             
         except Exception as e:
             # Log error but don't crash - we might still have some results
@@ -210,24 +241,39 @@ class TemplateCrawler:
             
         Why: Aggregating multiple queries increases the diversity of templates
         we can discover, leading to a more robust training dataset.
-        """
-        all_results = []
         
-        for query in PipelineConfig.TEMPLATE_SEARCH_QUERIES:
-            results = await self.search_templates(query, max_results=5)
-            all_results.extend(results)
-            await self._human_delay()  # Delay between queries
-            
-        # Remove duplicates based on URL
-        unique_results = {r['url']: r for r in all_results}.values()
+        Why gather: Each query runs in its own page of the shared context, so they
+        are launched concurrently and total crawl time is bounded by the slowest
+        query rather than the sum of all of them.
+        """
+        queries = PipelineConfig.TEMPLATE_SEARCH_QUERIES
+        results_lists = await asyncio.gather(
+            *(self.search_templates(query, max_results=5) for query in queries),
+            return_exceptions=True
+        )
         
+        # Flatten and drop duplicate URLs in one pass, keeping first-seen order
+        unique_results: List[Dict[str, str]] = []
+        seen_urls: Set[str] = set()
+        for query, results in zip(queries, results_lists):
+            if isinstance(results, BaseException):
+                log_with_context(
+                    logger, 'error', 'Template search failed',
+                    query=query, error=str(results), error_type=type(results).__name__
+                )
+                continue
+            for result in results:
+                if result['url'] not in seen_urls:
+                    seen_urls.add(result['url'])
+                    unique_results.append(result)
+                    
         log_with_context(
             logger, 'info', 'Crawling completed',
-            total_queries=len(PipelineConfig.TEMPLATE_SEARCH_QUERIES),
+            total_queries=len(queries),
             unique_templates=len(unique_results)
         )
         
-        return list(unique_results)
+        return unique_results
 
 
 async def run_crawler() -> List[Dict[str, str]]:
@@ -9,9 +9,13 @@ dataset with known PII locations, which is essential for training and validating
 ML models without privacy concerns.
 """
 
+import io
+import os
 import random
 import string
-from typing import List, Tuple, Dict, Any
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Tuple, Dict, Any, Optional
 from pathlib import Path
 import numpy as np
 import cv2
@@ -24,12 +28,78 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 from config import PipelineConfig
-from utils.logger import setup_logger, log_with_context
+from utils.logger import setup_logger, log_with_context, init_process_logging
 
 
 logger = setup_logger(__name__)
 
 
+# Font size 80/55 at 2480x3508 (A4@300DPI) ensures EasyOCR can read the text
+# reliably even after scan simulation effects are applied.
+_FONT_PATHS_BOLD = [
+    "/usr/share/fonts/TTF/Roboto-Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/Adwaita/AdwaitaSans-Regular.ttf",
+]
+_FONT_PATHS_REGULAR = [
+    "/usr/share/fonts/TTF/Roboto-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/Adwaita/AdwaitaSans-Regular.ttf",
+]
+
+
+@lru_cache(maxsize=1)
+def _probe_fonts() -> Tuple[ImageFont.ImageFont, ImageFont.ImageFont]:
+    """
+    Find and load the title and body fonts, once per process.
+    
+    Returns:
+        Tuple of (font_title, font_text)
+        
+    Why fallbacks: Font locations differ between distributions, so we try
+    several and fall back to PIL's default font if none is available.
+    
+    Why cached: The probe (including the failed opens of missing candidates)
+    and the FreeType parse then happen once per process, not per generator.
+    """
+    font_title = None
+    font_text = None
+    for path in _FONT_PATHS_BOLD:
+        try:
+            font_title = ImageFont.truetype(path, 80)
+            break
+        except IOError:
+            continue
+    for path in _FONT_PATHS_REGULAR:
+        try:
+            font_text = ImageFont.truetype(path, 55)
+            break
+        except IOError:
+            continue
+    if font_title is None or font_text is None:
+        font_title = ImageFont.load_default(size=80)
+        font_text = ImageFont.load_default(size=55)
+        logger.warning("Could not load any TrueType font, using PIL default")
+        
+    return font_title, font_text
+
+
+def _pii_location(
+    pii_type: str,
+    value: str,
+    approx_position: Tuple[float, float],
+    page: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build one pii_locations entry (CCCDs also record their length)."""
+    location: Dict[str, Any] = {"type": pii_type, "value": value}
+    if pii_type == "cccd":
+        location["value_length"] = len(value)
+    if page is not None:
+        location["page"] = page
+    location["approx_position"] = approx_position
+    return location
+
+
 class VietnameseNameGenerator:
     """
     Generator for realistic Vietnamese names.
@@ -61,26 +131,28 @@ class VietnameseNameGenerator:
     ]
     
     @classmethod
-    def generate(cls, gender: str = "random") -> str:
+    def generate(cls, gender: str = "random", rng: Optional[random.Random] = None) -> str:
         """
         Generate a random Vietnamese full name.
         
         Args:
             gender: 'male', 'female', or 'random'
+            rng: Random instance to draw from (the module-level one if omitted)
             
         Returns:
             Full Vietnamese name with proper diacritics
         """
+        rng = rng or random
         if gender == "random":
-            gender = random.choice(["male", "female"])
+            gender = rng.choice(["male", "female"])
             
-        surname = random.choice(cls.SURNAMES)
-        middle = random.choice(cls.MIDDLE_NAMES)
+        surname = rng.choice(cls.SURNAMES)
+        middle = rng.choice(cls.MIDDLE_NAMES)
         
         if gender == "male":
-            given = random.choice(cls.GIVEN_NAMES_MALE)
+            given = rng.choice(cls.GIVEN_NAMES_MALE)
         else:
-            given = random.choice(cls.GIVEN_NAMES_FEMALE)
+            given = rng.choice(cls.GIVEN_NAMES_FEMALE)
             
         return f"{surname} {middle} {given}"
 
@@ -94,7 +166,7 @@ class DocumentDataGenerator:
     """
     
     @staticmethod
-    def generate_cccd() -> str:
+    def generate_cccd(rng: Optional[random.Random] = None) -> str:
         """
         Generate a random 12-digit Citizen ID (CCCD).
         
@@ -104,28 +176,31 @@ class DocumentDataGenerator:
         Why 12 digits: Vietnamese CCCD follows a specific 12-digit format.
         While these are random, they match the pattern OCR will be trained to detect.
         """
-        return ''.join(random.choices(string.digits, k=12))
+        rng = rng or random
+        return ''.join(rng.choices(string.digits, k=12))
         
     @staticmethod
-    def generate_dob() -> str:
+    def generate_dob(rng: Optional[random.Random] = None) -> str:
         """
         Generate a random date of birth in Vietnamese format.
         
         Returns:
             Date string in DD/MM/YYYY format
         """
+        rng = rng or random
+        
         # Generate DOB between 1960 and 2000
         start_date = datetime(1960, 1, 1)
         end_date = datetime(2000, 12, 31)
         
         delta = end_date - start_date
-        random_days = random.randint(0, delta.days)
+        random_days = rng.randint(0, delta.days)
         dob = start_date + timedelta(days=random_days)
         
         return dob.strftime("%d/%m/%Y")
         
     @staticmethod
-    def generate_phone() -> str:
+    def generate_phone(rng: Optional[random.Random] = None) -> str:
         """
         Generate a Vietnamese mobile phone number.
         
@@ -133,12 +208,13 @@ class DocumentDataGenerator:
             10-digit phone number starting with 0
         """
         prefixes = ['09', '08', '07', '05', '03']  # Common Vietnamese mobile prefixes
-        prefix = random.choice(prefixes)
-        remaining = ''.join(random.choices(string.digits, k=8))
+        rng = rng or random
+        prefix = rng.choice(prefixes)
+        remaining = ''.join(rng.choices(string.digits, k=8))
         return f"{prefix}{remaining}"
         
     @staticmethod
-    def generate_address() -> str:
+    def generate_address(rng: Optional[random.Random] = None) -> str:
         """
         Generate a synthetic Vietnamese address.
         
@@ -149,12 +225,60 @@ class DocumentDataGenerator:
         districts = ["Quận 1", "Quận 3", "Quận 5", "Quận Bình Thạnh", "Quận Tân Bình"]
         cities = ["TP. Hồ Chí Minh", "Hà Nội", "Đà Nẵng", "Cần Thơ"]
         
-        number = random.randint(1, 500)
-        street = random.choice(streets)
-        district = random.choice(districts)
-        city = random.choice(cities)
+        rng = rng or random
+        number = rng.randint(1, 500)
+        street = rng.choice(streets)
+        district = rng.choice(districts)
+        city = rng.choice(cities)
         
         return f"{number} {street}, {district}, {city}"
+        
+    @staticmethod
+    def generate_batch(n: int, rng: Optional[np.random.Generator] = None) -> Dict[str, List[str]]:
+        """
+        Generate n CCCDs, dates of birth and phone numbers at once.
+        
+        Args:
+            n: Number of values per field
+            rng: NumPy generator to draw from (a fresh one if omitted)
+            
+        Returns:
+            Dictionary mapping 'cccd', 'dob' and 'phone' to lists of n strings,
+            in the same formats as the single-value generators above
+            
+        Why vectorized: Each field is a handful of array operations on ASCII
+        byte matrices instead of a Python-level random.choices/strftime call
+        per value, so a whole run's worth of PII costs a few C loops.
+        """
+        rng = rng or np.random.default_rng()
+        zero = ord('0')
+        
+        # CCCD: n x 12 ASCII digits viewed as fixed-width byte strings
+        cccd = rng.integers(0, 10, size=(n, 12), dtype=np.uint8) + zero
+        
+        # Phone: two-byte mobile prefix followed by 8 random digits
+        prefixes = np.frombuffer(b'0908070503', dtype=np.uint8).reshape(-1, 2)
+        phone = np.empty((n, 10), dtype=np.uint8)
+        phone[:, :2] = prefixes[rng.integers(0, len(prefixes), size=n)]
+        phone[:, 2:] = rng.integers(0, 10, size=(n, 8), dtype=np.uint8) + zero
+        
+        # DOB between 1960 and 2000: ISO YYYY-MM-DD bytes reordered to DD/MM/YYYY
+        start = np.datetime64('1960-01-01')
+        span = (np.datetime64('2000-12-31') - start).astype(int)
+        dates = start + rng.integers(0, span + 1, size=n).astype('timedelta64[D]')
+        iso = np.datetime_as_string(dates).astype('S10').view(np.uint8).reshape(n, 10)
+        dob = np.empty((n, 10), dtype=np.uint8)
+        dob[:, [0, 1, 3, 4, 6, 7, 8, 9]] = iso[:, [8, 9, 5, 6, 0, 1, 2, 3]]
+        dob[:, [2, 5]] = ord('/')
+        
+        def to_strings(chars: np.ndarray) -> List[str]:
+            return chars.view(f'S{chars.shape[1]}').ravel().astype(str).tolist()
+            
+        return {
+            "cccd": to_strings(cccd),
+            "dob": to_strings(dob),
+            "phone": to_strings(phone),
+        }
 
 
 class PDFDocumentGenerator:
@@ -166,16 +290,61 @@ class PDFDocumentGenerator:
     for tracking PII locations.
     """
     
+    TITLE_MAP = {
+        "sales_contract": "HỢP ĐỒNG MUA BÁN NHÀ ĐẤT",
+        "deposit_contract": "HỢP ĐỒNG ĐẶT CỌC BẤT ĐỘNG SẢN",
+        "lease_agreement": "HỢP ĐỒNG THUÊ NHÀ"
+    }
+    DEFAULT_TITLE = "HỢP ĐỒNG"
+    TITLE_FONT = "Helvetica-Bold"
+    TITLE_FONT_SIZE = 16
+    CLAUSES_TEXT = "Điều khoản chi tiết về quyền và nghĩa vụ của các bên..."
+    
+    # Label template for each PII field, filled with str.format_map
+    FIELD_TEMPLATES = {
+        "name": "Ông/Bà: {value}",
+        "cccd": "CCCD số: {value}",
+        "dob": "Ngày sinh: {value}",
+        "phone": "Điện thoại: {value}",
+    }
+    # (header, index into pii_values, fields) for each contract party
+    PARTIES = (
+        ("BÊN A (Bên bán/cho thuê):", 0, ("name", "cccd", "dob", "phone")),
+        ("BÊN B (Bên mua/thuê):", 1, ("name", "cccd", "dob")),
+    )
+    
+    # Left x of each centred title, keyed by (title, font, size). Titles are
+    # static, so their font metrics are measured once per process.
+    _title_x_cache: Dict[Tuple[str, str, int], float] = {}
+    
     def __init__(self):
-        """Initialize the PDF generator."""
+        """
+        Initialize the PDF generator.
+        
+        Why a private Random: Seeded from os.urandom when the generator is
+        built, so generators created in different pool workers never share
+        a stream, whether the workers were forked or spawned.
+        """
         self.data_generator = DocumentDataGenerator()
         self.name_generator = VietnameseNameGenerator()
+        self._rng = random.Random(os.urandom(8))
+        
+    @classmethod
+    def _title_x(cls, title: str) -> float:
+        """Return the x at which `title` starts when centred on an A4 page."""
+        key = (title, cls.TITLE_FONT, cls.TITLE_FONT_SIZE)
+        x = cls._title_x_cache.get(key)
+        if x is None:
+            text_width = pdfmetrics.stringWidth(title, cls.TITLE_FONT, cls.TITLE_FONT_SIZE)
+            x = cls._title_x_cache[key] = (A4[0] - text_width) / 2
+        return x
         
     def _create_contract_template(
         self, 
         pdf_canvas: canvas.Canvas, 
         doc_type: str,
-        page_num: int
+        page_num: int,
+        pii_values: Dict[str, List[str]]
     ) -> List[Dict[str, Any]]:
         """
         Create a contract page template with PII placeholders.
@@ -184,6 +353,8 @@ class PDFDocumentGenerator:
             pdf_canvas: ReportLab canvas object
             doc_type: Type of document (sales_contract, deposit_contract, etc.)
             page_num: Current page number
+            pii_values: Pre-generated values (see DocumentDataGenerator.generate_batch);
+                index 0 is used for party A, index 1 for party B
             
         Returns:
             List of dictionaries tracking PII locations
@@ -194,111 +365,51 @@ class PDFDocumentGenerator:
         pii_locations = []
         width, height = A4
         
-        # Title
-        pdf_canvas.setFont("Helvetica-Bold", 16)
-        title_map = {
-            "sales_contract": "HỢP ĐỒNG MUA BÁN NHÀ ĐẤT",
-            "deposit_contract": "HỢP ĐỒNG ĐẶT CỌC BẤT ĐỘNG SẢN",
-            "lease_agreement": "HỢP ĐỒNG THUÊ NHÀ"
-        }
-        title = title_map.get(doc_type, "HỢP ĐỒNG")
-        pdf_canvas.drawCentredString(width / 2, height - 80, title)
+        # Title (centred; x precomputed from cached font metrics)
+        pdf_canvas.setFont(self.TITLE_FONT, self.TITLE_FONT_SIZE)
+        title = self.TITLE_MAP.get(doc_type, self.DEFAULT_TITLE)
+        pdf_canvas.drawString(self._title_x(title), height - 80, title)
         
         # Only add PII data on first page to avoid duplication
         if page_num == 0:
             pdf_canvas.setFont("Helvetica", 11)
             y_position = height - 150
             
-            # Party A (Seller/Landlord)
-            pdf_canvas.drawString(100, y_position, "BÊN A (Bên bán/cho thuê):")
-            y_position -= 25
-            
-            name_a = self.name_generator.generate()
-            pdf_canvas.drawString(100, y_position, f"Ông/Bà: {name_a}")
-            pii_locations.append({
-                "type": "name",
-                "value": name_a,
-                "page": page_num,
-                "approx_position": (100, height - y_position)
-            })
-            y_position -= 20
-            
-            cccd_a = self.data_generator.generate_cccd()
-            pdf_canvas.drawString(100, y_position, f"CCCD số: {cccd_a}")
-            pii_locations.append({
-                "type": "cccd",
-                "value": cccd_a,
-                "value_length": 12,
-                "page": page_num,
-                "approx_position": (100, height - y_position)
-            })
-            y_position -= 20
-            
-            dob_a = self.data_generator.generate_dob()
-            pdf_canvas.drawString(100, y_position, f"Ngày sinh: {dob_a}")
-            pii_locations.append({
-                "type": "dob",
-                "value": dob_a,
-                "page": page_num,
-                "approx_position": (100, height - y_position)
-            })
-            y_position -= 20
-            
-            phone_a = self.data_generator.generate_phone()
-            pdf_canvas.drawString(100, y_position, f"Điện thoại: {phone_a}")
-            pii_locations.append({
-                "type": "phone",
-                "value": phone_a,
-                "page": page_num,
-                "approx_position": (100, height - y_position)
-            })
-            y_position -= 40
-            
-            # Party B (Buyer/Tenant)
-            pdf_canvas.drawString(100, y_position, "BÊN B (Bên mua/thuê):")
-            y_position -= 25
-            
-            name_b = self.name_generator.generate()
-            pdf_canvas.drawString(100, y_position, f"Ông/Bà: {name_b}")
-            pii_locations.append({
-                "type": "name",
-                "value": name_b,
-                "page": page_num,
-                "approx_position": (100, height - y_position)
-            })
-            y_position -= 20
-            
-            cccd_b = self.data_generator.generate_cccd()
-            pdf_canvas.drawString(100, y_position, f"CCCD số: {cccd_b}")
-            pii_locations.append({
-                "type": "cccd",
-                "value": cccd_b,
-                "value_length": 12,
-                "page": page_num,
-                "approx_position": (100, height - y_position)
-            })
-            y_position -= 20
-            
-            dob_b = self.data_generator.generate_dob()
-            pdf_canvas.drawString(100, y_position, f"Ngày sinh: {dob_b}")
-            pii_locations.append({
-                "type": "dob",
-                "value": dob_b,
-                "page": page_num,
-                "approx_position": (100, height - y_position)
-            })
-            
+            for header, party_idx, fields in self.PARTIES:
+                # One text object per party: header, then a line per field.
+                # Field i sits 25pt below the header plus 20pt per line.
+                text = pdf_canvas.beginText(100, y_position)
+                text.setFont("Helvetica", 11, leading=25)
+                text.textLine(header)
+                text.setLeading(20)
+                
+                for i, field in enumerate(fields):
+                    if field == "name":
+                        value = self.name_generator.generate(rng=self._rng)
+                    else:
+                        value = pii_values[field][party_idx]
+                    text.textLine(self.FIELD_TEMPLATES[field].format_map({"value": value}))
+                    field_y = y_position - 25 - i * 20
+                    pii_locations.append(
+                        _pii_location(field, value, (100, height - field_y), page_num)
+                    )
+                    
+                pdf_canvas.drawText(text)
+                
+                # Move past the block, plus an extra gap after each party
+                y_position -= 25 + 20 * len(fields) + 20
+                
             # Add some boilerplate contract text
-            y_position -= 40
             pdf_canvas.drawString(100, y_position, "Hai bên thỏa thuận ký kết hợp đồng với các điều khoản sau:")
             
         else:
-            # Subsequent pages - just boilerplate
-            pdf_canvas.setFont("Helvetica", 11)
-            y_position = height - 150
-            pdf_canvas.drawString(100, y_position, f"Trang {page_num + 1}")
-            y_position -= 30
-            pdf_canvas.drawString(100, y_position, "Điều khoản chi tiết về quyền và nghĩa vụ của các bên...")
+            # Subsequent pages - just boilerplate, emitted as one text object
+            # (30pt apart) instead of one drawString per line
+            text = pdf_canvas.beginText(100, height - 150)
+            text.setFont("Helvetica", 11, leading=30)
+            text.textLine(f"Trang {page_num + 1}")
+            text.textLine(self.CLAUSES_TEXT)
+            pdf_canvas.drawText(text)
             
         return pii_locations
         
@@ -306,7 +417,9 @@ class PDFDocumentGenerator:
         self, 
         output_path: Path, 
         doc_type: str, 
-        num_pages: int
+        num_pages: int,
+        pii_values: Optional[Dict[str, List[str]]] = None,
+        generated_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate a complete multi-page PDF document.
@@ -315,6 +428,10 @@ class PDFDocumentGenerator:
             output_path: Where to save the PDF
             doc_type: Type of contract
             num_pages: Number of pages to generate
+            pii_values: Pre-generated PII values (two per field); generated
+                on the spot if omitted
+            generated_at: ISO timestamp to record (e.g. shared by a whole
+                batch); the current UTC time if omitted
             
         Returns:
             Dictionary containing filename, doc_type, and PII locations
@@ -324,15 +441,20 @@ class PDFDocumentGenerator:
         """
         logger.info(f"Generating PDF: {output_path.name}")
         
-        pdf = canvas.Canvas(str(output_path), pagesize=A4)
+        pii_values = pii_values or self.data_generator.generate_batch(2)
+        # Render into memory and write the finished file in one call, rather
+        # than streaming many small writes through a file object
+        buffer = io.BytesIO()
+        pdf = canvas.Canvas(buffer, pagesize=A4)
         all_pii_locations = []
         
         for page_num in range(num_pages):
-            pii_locs = self._create_contract_template(pdf, doc_type, page_num)
+            pii_locs = self._create_contract_template(pdf, doc_type, page_num, pii_values)
             all_pii_locations.extend(pii_locs)
             pdf.showPage()
             
         pdf.save()
+        output_path.write_bytes(buffer.getvalue())
         
         log_with_context(
             logger, 'info', 'PDF generated',
@@ -346,7 +468,7 @@ class PDFDocumentGenerator:
             "doc_type": doc_type,
             "page_count": num_pages,
             "pii_locations": all_pii_locations,
-            "generated_at": datetime.utcnow().isoformat()
+            "generated_at": generated_at or datetime.utcnow().isoformat()
         }
 
 
@@ -358,60 +480,67 @@ class ImageDocumentGenerator:
     Supporting both formats makes the pipeline more versatile.
     """
     
+    # A4 at 300 DPI
+    WIDTH, HEIGHT = 2480, 3508
+    
+    # (field, label template) in drawing order
+    FIELD_TEMPLATES = (
+        ("name", "Ông/Bà: {value}"),
+        ("cccd", "CCCD: {value}"),
+        ("dob", "Ngày sinh: {value}"),
+    )
+    
     def __init__(self):
-        """Initialize the image generator."""
+        """
+        Initialize the image generator.
+        
+        Why load here: The page canvas (~26 MB) and the FreeType faces are the
+        same for every document, so they are created once and reused by each
+        generate_image() call instead of being rebuilt per document (fonts
+        are probed once per process, see _probe_fonts). The
+        private Random is seeded from os.urandom so each pool worker's
+        generator draws its own stream.
+        """
         self.data_generator = DocumentDataGenerator()
         self.name_generator = VietnameseNameGenerator()
-        
-    def generate_image(self, output_path: Path, doc_type: str) -> Dict[str, Any]:
+        self._rng = random.Random(os.urandom(8))
+        self.scanner = ScannedDocumentSimulator(self._rng)
+        self.font_title, self.font_text = _probe_fonts()
+        self._canvas = Image.new('RGB', (self.WIDTH, self.HEIGHT), color='white')
+        
+    def generate_image(
+        self,
+        output_path: Path,
+        doc_type: str,
+        pii_values: Optional[Dict[str, List[str]]] = None,
+        scan_effects: bool = False,
+        generated_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Generate a document image with PII.
         
         Args:
             output_path: Where to save the image
             doc_type: Type of document
+            pii_values: Pre-generated PII values (index 0 is used); generated
+                on the spot if omitted
+            scan_effects: Run ScannedDocumentSimulator on the rendered page
+                in memory before it is written
+            generated_at: ISO timestamp to record; the current UTC time if omitted
             
         Returns:
             Dictionary with metadata and PII locations
         """
         logger.info(f"Generating image: {output_path.name}")
         
-        # Create blank image (A4 proportions)
-        width, height = 2480, 3508  # A4 at 300 DPI
-        image = Image.new('RGB', (width, height), color='white')
-        draw = ImageDraw.Draw(image)
+        pii_values = pii_values or self.data_generator.generate_batch(1)
         
-        # Try to use a default font (fallback to default if not available)
-        # Font size 80/55 at 2480x3508 (A4@300DPI) ensures EasyOCR can read the text
-        # reliably even after scan simulation effects are applied.
-        FONT_PATHS_BOLD = [
-            "/usr/share/fonts/TTF/Roboto-Bold.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/Adwaita/AdwaitaSans-Regular.ttf",
-        ]
-        FONT_PATHS_REGULAR = [
-            "/usr/share/fonts/TTF/Roboto-Regular.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/Adwaita/AdwaitaSans-Regular.ttf",
-        ]
-        font_title = None
-        font_text = None
-        for path in FONT_PATHS_BOLD:
-            try:
-                font_title = ImageFont.truetype(path, 80)
-                break
-            except IOError:
-                continue
-        for path in FONT_PATHS_REGULAR:
-            try:
-                font_text = ImageFont.truetype(path, 55)
-                break
-            except IOError:
-                continue
-        if font_title is None or font_text is None:
-            font_title = ImageFont.load_default(size=80)
-            font_text = ImageFont.load_default(size=55)
-            logger.warning("Could not load any TrueType font, using PIL default")
+        # Reset the reused canvas to a blank page (a single fill, no allocation)
+        width, height = self.WIDTH, self.HEIGHT
+        image = self._canvas
+        image.paste('white', (0, 0, width, height))
+        draw = ImageDraw.Draw(image)
+        font_title, font_text = self.font_title, self.font_text
         
         pii_locations = []
         
@@ -422,22 +551,21 @@ class ImageDocumentGenerator:
         # Generate PII content
         y_pos = 400
         
-        name = self.name_generator.generate()
-        draw.text((200, y_pos), f"Ông/Bà: {name}", fill='black', font=font_text)
-        pii_locations.append({"type": "name", "value": name, "approx_position": (200, y_pos)})
-        y_pos += 80
-        
-        cccd = self.data_generator.generate_cccd()
-        draw.text((200, y_pos), f"CCCD: {cccd}", fill='black', font=font_text)
-        pii_locations.append({"type": "cccd", "value": cccd, "value_length": 12, "approx_position": (200, y_pos)})
-        y_pos += 80
-        
-        dob = self.data_generator.generate_dob()
-        draw.text((200, y_pos), f"Ngày sinh: {dob}", fill='black', font=font_text)
-        pii_locations.append({"type": "dob", "value": dob, "approx_position": (200, y_pos)})
-        
-        # Save image
-        image.save(output_path)
+        for field, template in self.FIELD_TEMPLATES:
+            if field == "name":
+                value = self.name_generator.generate(rng=self._rng)
+            else:
+                value = pii_values[field][0]
+            draw.text((200, y_pos), template.format_map({"value": value}), fill='black', font=font_text)
+            pii_locations.append(_pii_location(field, value, (200, y_pos)))
+            y_pos += 80
+        
+        # Save image (encoded once, after any scan simulation)
+        if scan_effects:
+            gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+            cv2.imwrite(str(output_path), self.scanner.simulate_scan(gray))
+        else:
+            image.save(output_path)
         
         log_with_context(
             logger, 'info', 'Image generated',
@@ -449,7 +577,7 @@ class ImageDocumentGenerator:
             "filename": output_path.name,
             "doc_type": doc_type,
             "pii_locations": pii_locations,
-            "generated_at": datetime.utcnow().isoformat()
+            "generated_at": generated_at or datetime.utcnow().isoformat()
         }
 
 
@@ -461,10 +589,20 @@ class ScannedDocumentSimulator:
     grayscale conversion). Simulating these effects makes training data more realistic.
     """
     
-    @staticmethod
-    def apply_scan_effects(image_path: Path) -> None:
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize the simulator.
+        
+        Args:
+            rng: Random instance for scan variation (a fresh, urandom-seeded
+                one if omitted)
+        """
+        self._rng = rng or random.Random(os.urandom(8))
+        self._np_rng = np.random.default_rng()
+        
+    def apply_scan_effects(self, image_path: Path) -> None:
         """
-        Apply realistic scanning effects to an image.
+        Apply realistic scanning effects to an image file.
         
         Args:
             image_path: Path to the image file to modify
@@ -484,31 +622,107 @@ class ScannedDocumentSimulator:
         # Convert to grayscale (common for scans)
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         
-        # Add slight Gaussian noise
-        noise = np.random.normal(0, 5, gray.shape).astype(np.uint8)
-        noisy = cv2.add(gray, noise)
+        # Save processed image
+        cv2.imwrite(str(image_path), self.simulate_scan(gray))
         
-        # Apply slight blur (simulates scan quality)
-        blurred = cv2.GaussianBlur(noisy, (3, 3), 0)
+        logger.debug(f"Scan effects applied to {image_path.name}")
         
-        # Slight random rotation (-2 to +2 degrees)
-        angle = random.uniform(-2, 2)
-        h, w = blurred.shape
+    def simulate_scan(self, gray: np.ndarray) -> np.ndarray:
+        """
+        Apply realistic scanning effects to an in-memory grayscale image.
+        
+        Args:
+            gray: Grayscale image as a uint8 numpy array
+            
+        Returns:
+            New grayscale image with noise, blur, rotation and contrast drift
+            
+        Why array-based: Freshly generated images can go straight through this
+        and be encoded once, instead of a PNG write/read round-trip.
+        """
+        # Add slight sensor noise: signed integer noise (std ~5, like the old
+        # N(0, 5)) added with saturation straight back to uint8. Drawing ints
+        # skips the float64 pass, and keeping the sign means the noise both
+        # darkens and lightens instead of wrapping negatives to ~255.
+        # cv2.add takes the uint8 page and int16 noise as-is (mixed depths
+        # are allowed when dtype is given), so no int16 copy of the page is
+        # made.
+        noise = self._np_rng.integers(-8, 9, size=gray.shape, dtype=np.int16)
+        noisy = cv2.add(gray, noise, dtype=cv2.CV_8U)
+        
+        # Scan variation: slight rotation (-2 to +2 degrees) plus contrast and
+        # brightness drift
+        angle = self._rng.uniform(-2, 2)
+        alpha = self._rng.uniform(0.9, 1.1)  # Contrast
+        beta = self._rng.randint(-10, 10)     # Brightness
+        
+        # Apply slight blur (simulates scan quality) with the contrast and
+        # brightness folded in: blur and alpha*x + beta are both linear, so
+        # one filter2D pass with an alpha-scaled Gaussian kernel and
+        # delta=beta replaces GaussianBlur + convertScaleAbs.
+        gaussian = cv2.getGaussianKernel(3, 0)
+        kernel = (gaussian @ gaussian.T) * alpha
+        adjusted = cv2.filter2D(noisy, -1, kernel, delta=beta)
+        
+        # Rotate. Intensity scaling commutes with the warp's interpolation,
+        # so only the fill colour needs the contrast/brightness applied.
+        h, w = adjusted.shape
         center = (w // 2, h // 2)
         rotation_matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
-        rotated = cv2.warpAffine(blurred, rotation_matrix, (w, h), 
-                                  borderMode=cv2.BORDER_CONSTANT, 
-                                  borderValue=255)
-        
-        # Adjust contrast (simulate scan settings variation)
-        alpha = random.uniform(0.9, 1.1)  # Contrast
-        beta = random.randint(-10, 10)     # Brightness
-        adjusted = cv2.convertScaleAbs(rotated, alpha=alpha, beta=beta)
-        
-        # Save processed image
-        cv2.imwrite(str(image_path), adjusted)
+        border_value = int(np.clip(round(255 * alpha + beta), 0, 255))
+        adjusted = cv2.warpAffine(adjusted, rotation_matrix, (w, h),
+                                  borderMode=cv2.BORDER_CONSTANT,
+                                  borderValue=border_value)
         
-        logger.debug(f"Scan effects applied to {image_path.name}")
+        return adjusted
+
+
+# Per-process generators, populated by _init_generator_worker() once in every
+# pool worker.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_generator_worker() -> None:
+    """
+    Build the generators for one pool worker.
+    
+    Why: Each generator seeds its own Random (and NumPy Generator) from OS
+    entropy when constructed here, inside the worker, so forked workers do
+    not replay the parent's RNG state and spawned ones are not identical.
+    """
+    init_process_logging()
+    _WORKER_STATE['pdf_generator'] = PDFDocumentGenerator()
+    _WORKER_STATE['image_generator'] = ImageDocumentGenerator()
+
+
+def _generate_pdf_job(
+    output_path: Path,
+    doc_type: str,
+    num_pages: int,
+    pii_values: Dict[str, List[str]],
+    generated_at: str
+) -> Dict[str, Any]:
+    """Pool task: generate one PDF document."""
+    return _WORKER_STATE['pdf_generator'].generate_pdf(
+        output_path, doc_type, num_pages, pii_values, generated_at
+    )
+
+
+def _generate_image_job(
+    output_path: Path,
+    doc_type: str,
+    pii_values: Dict[str, List[str]],
+    generated_at: str
+) -> Dict[str, Any]:
+    """
+    Pool task: generate one image document with scan effects applied.
+    
+    Why one task: Scan effects depend only on the page just rendered, so
+    they run in the same worker on the in-memory image before it is saved.
+    """
+    return _WORKER_STATE['image_generator'].generate_image(
+        output_path, doc_type, pii_values, scan_effects=True, generated_at=generated_at
+    )
 
 
 def generate_all_documents() -> List[Dict[str, Any]]:
@@ -520,16 +734,27 @@ def generate_all_documents() -> List[Dict[str, Any]]:
         
     Why: Orchestrates the entire document generation process, ensuring
     proper distribution across document types and formats.
+    
+    Why a process pool: Every document is independent and generation is
+    CPU-bound (ReportLab layout, PIL rendering, OpenCV filters), so one task
+    per document scales with the number of cores. Document types and page
+    counts are still drawn here, so the distribution is unchanged.
     """
     PipelineConfig.ensure_directories()
     
-    pdf_generator = PDFDocumentGenerator()
-    image_generator = ImageDocumentGenerator()
-    scanner = ScannedDocumentSimulator()
+    # Numeric PII for every document in one vectorized draw: two values per
+    # field per document (party A and B), sliced out as jobs are created.
+    doc_count = PipelineConfig.TARGET_PDF_COUNT + PipelineConfig.TARGET_IMAGE_COUNT
+    pii_batch = DocumentDataGenerator.generate_batch(2 * doc_count)
+    
+    def pii_values_for(job_idx: int) -> Dict[str, List[str]]:
+        return {field: values[2 * job_idx:2 * job_idx + 2] for field, values in pii_batch.items()}
+        
+    # One timestamp for the whole batch instead of a clock read per document
+    batch_ts = datetime.utcnow().isoformat()
     
-    all_metadata = []
+    jobs = []
     
-    # Generate PDFs
     logger.info(f"Generating {PipelineConfig.TARGET_PDF_COUNT} PDF documents")
     for i in range(PipelineConfig.TARGET_PDF_COUNT):
         doc_type = random.choice(PipelineConfig.DOCUMENT_TYPES)
@@ -540,22 +765,37 @@ def generate_all_documents() -> List[Dict[str, Any]]:
         
         filename = f"{doc_type}_{i+1:02d}.pdf"
         output_path = PipelineConfig.get_output_path(filename)
+        jobs.append((
+            _generate_pdf_job,
+            (output_path, doc_type, num_pages, pii_values_for(len(jobs)), batch_ts)
+        ))
         
-        metadata = pdf_generator.generate_pdf(output_path, doc_type, num_pages)
-        all_metadata.append(metadata)
-        
-    # Generate standalone images
     logger.info(f"Generating {PipelineConfig.TARGET_IMAGE_COUNT} image documents")
     for i in range(PipelineConfig.TARGET_IMAGE_COUNT):
         doc_type = random.choice(PipelineConfig.DOCUMENT_TYPES)
         filename = f"{doc_type}_img_{i+1:02d}.png"
         output_path = PipelineConfig.get_output_path(filename)
-        
-        metadata = image_generator.generate_image(output_path, doc_type)
-        all_metadata.append(metadata)
-        
-        # Apply scan effects to images
-        scanner.apply_scan_effects(output_path)
+        jobs.append((
+            _generate_image_job,
+            (output_path, doc_type, pii_values_for(len(jobs)), batch_ts)
+        ))
+        
+    # Results land in submission order (PDFs first, then images) whatever
+    # order the workers finish in.
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_generator_worker
+    ) as executor:
+        futures = {
+            executor.submit(job, *args): idx
+            for idx, (job, args) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            
+    all_metadata = [metadata for metadata in results if metadata is not None]
         
     log_with_context(
         logger, 'info', 'Document generation completed',
@@ -9,20 +9,37 @@ and doesn't require separate language pack installations like Tesseract.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
 from pathlib import Path
 import numpy as np
 import cv2
-from pdf2image import convert_from_path
 import easyocr
 
 from config import PipelineConfig
 from utils.logger import setup_logger, log_with_context
+from utils.pdf_render import render_pdf_pages
 
 
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_reader(languages: Tuple[str, ...], gpu: bool) -> easyocr.Reader:
+    """
+    Build (once per process) the EasyOCR reader for a language set.
+    
+    Why module scope: Loading the detector and recognizer weights takes
+    seconds. Caching the reader here means every OCREngine in a pool worker
+    shares one model instead of loading its own.
+    """
+    return easyocr.Reader(
+        lang_list=list(languages),
+        gpu=gpu,
+        verbose=False  # Suppress EasyOCR's internal logging
+    )
+
+
 class OCREngine:
     """
     Wrapper for EasyOCR with optimized configuration for document processing.
@@ -39,14 +56,13 @@ class OCREngine:
         Initialize the OCR reader.
         
         Why lazy loading: EasyOCR model loading is expensive. We do it once
-        during initialization and reuse the reader for all documents.
+        per process (see _get_reader) and reuse the reader for all documents.
         """
         logger.info("Initializing EasyOCR reader")
         try:
-            self.reader = easyocr.Reader(
-                lang_list=PipelineConfig.OCR_LANGUAGES,
-                gpu=PipelineConfig.OCR_GPU,
-                verbose=False  # Suppress EasyOCR's internal logging
+            self.reader = _get_reader(
+                tuple(PipelineConfig.OCR_LANGUAGES),
+                PipelineConfig.OCR_GPU
             )
             logger.info("EasyOCR reader initialized successfully")
         except Exception as e:
@@ -81,11 +97,37 @@ class OCREngine:
             cv2.THRESH_BINARY, 11, 2
         )
         
-        # Denoise
-        denoised = cv2.fastNlMeansDenoising(binary, h=10)
+        # Denoise: after thresholding the noise is salt-and-pepper, which a
+        # 3x3 median removes at a tiny fraction of non-local means' cost
+        denoised = cv2.medianBlur(binary, 3)
         
         return denoised
         
+    def _needs_preprocessing(self, image: np.ndarray) -> bool:
+        """
+        Decide whether an image is degraded enough to need preprocessing.
+        
+        Args:
+            image: Input image as numpy array
+            
+        Returns:
+            True if the image looks like a noisy/blurred scan
+            
+        Why: Thresholding and denoising help on poor scans but cost a full
+        pass and can hurt EasyOCR on clean renders. The variance of the
+        Laplacian of a small thumbnail is a cheap sharpness estimate: crisp,
+        clean pages score high.
+        """
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = image
+            
+        thumbnail = cv2.resize(gray, (400, 400), interpolation=cv2.INTER_AREA)
+        sharpness = cv2.Laplacian(thumbnail, cv2.CV_32F).var()
+        
+        return sharpness < PipelineConfig.OCR_SHARPNESS_THRESHOLD
+        
     def extract_text_from_image(
         self, 
         image: np.ndarray,
@@ -126,6 +168,65 @@ class OCREngine:
             )
             return []
             
+    def extract_text_from_images(
+        self,
+        images: List[np.ndarray],
+        preprocess: bool = True
+    ) -> List[List[Tuple[List[List[int]], str, float]]]:
+        """
+        Extract text from several images in batched EasyOCR calls.
+        
+        Args:
+            images: Images as numpy arrays (e.g. the pages of one PDF)
+            preprocess: Whether to apply preprocessing
+            
+        Returns:
+            One result list per input image, in the same format as
+            extract_text_from_image
+            
+        Why batched: Each readtext() call pays the model's fixed launch and
+        synchronisation overhead. readtext_batched runs the detector and
+        recognizer over several pages at once, amortising it. EasyOCR stacks
+        the batch, so pages of different sizes fall back to one call each.
+        """
+        if len({image.shape[:2] for image in images}) > 1:
+            return [self.extract_text_from_image(image, preprocess) for image in images]
+            
+        try:
+            if preprocess:
+                images = [self._preprocess_image(image) for image in images]
+                
+            results = self.reader.readtext_batched(
+                images,
+                batch_size=PipelineConfig.OCR_BATCH_SIZE
+            )
+            
+            log_with_context(
+                logger, 'debug', 'Batched OCR extraction completed',
+                images=len(images),
+                text_regions_found=sum(len(page) for page in results)
+            )
+            
+            return results
+            
+        except Exception as e:
+            log_with_context(
+                logger, 'error', 'Batched OCR extraction failed',
+                error=str(e), error_type=type(e).__name__
+            )
+            return [[] for _ in images]
+            
+    @staticmethod
+    def _scale_results(
+        results: List[Tuple[List[List[int]], str, float]],
+        scale: float
+    ) -> List[Tuple[List[List[float]], str, float]]:
+        """Scale the bounding boxes of OCR results by a constant factor."""
+        return [
+            ([[x * scale, y * scale] for x, y in bbox], text, confidence)
+            for bbox, text, confidence in results
+        ]
+        
     def extract_text_from_pdf(self, pdf_path: Path) -> List[Dict[str, Any]]:
         """
         Extract text from all pages of a PDF.
@@ -138,36 +239,38 @@ class OCREngine:
             
         Why convert to images: PDF text extraction alone misses scanned PDFs.
         Converting to images ensures we can OCR any PDF type.
+        
+        Why two resolutions: Pages are OCR'd at OCR_DPI, which roughly halves
+        the pixels the text detector has to process while keeping body text
+        well above EasyOCR's minimum height. Bounding boxes and shapes are
+        then scaled to PDF_RENDER_DPI, the resolution the redactor renders
+        at, so boxes still land on the right pixels.
         """
         logger.info(f"Processing PDF: {pdf_path.name}")
         
         all_results = []
         
         try:
-            # Convert PDF pages to images
-            images = convert_from_path(
-                pdf_path, 
-                dpi=300,  # High DPI for better OCR accuracy
-                fmt='png'
-            )
+            # Render PDF pages to images
+            img_arrays = render_pdf_pages(pdf_path, dpi=PipelineConfig.OCR_DPI)
+            scale = PipelineConfig.PDF_RENDER_DPI / PipelineConfig.OCR_DPI
             
             log_with_context(
                 logger, 'info', 'PDF converted to images',
                 filename=pdf_path.name,
-                page_count=len(images)
+                page_count=len(img_arrays)
             )
             
-            for page_num, image in enumerate(images):
-                # Convert PIL Image to numpy array
-                img_array = np.array(image)
-                
-                # Extract text
-                ocr_results = self.extract_text_from_image(img_array)
-                
+            # OCR all pages together. Rendered PDF pages are pristine, so
+            # they skip preprocessing.
+            page_results = self.extract_text_from_images(img_arrays, preprocess=False)
+            
+            for page_num, (img_array, ocr_results) in enumerate(zip(img_arrays, page_results)):
+                height, width = img_array.shape[:2]
                 all_results.append({
                     'page': page_num,
-                    'image_shape': img_array.shape,
-                    'ocr_results': ocr_results
+                    'image_shape': (round(height * scale), round(width * scale)) + img_array.shape[2:],
+                    'ocr_results': self._scale_results(ocr_results, scale)
                 })
                 
                 log_with_context(
@@ -209,7 +312,10 @@ class OCREngine:
                 return []
                 
             # Extract text
-            ocr_results = self.extract_text_from_image(image)
+            ocr_results = self.extract_text_from_image(
+                image,
+                preprocess=self._needs_preprocessing(image)
+            )
             
             return [{
                 'page': 0,
@@ -9,15 +9,51 @@ PII like CCCD numbers and dates. It's faster than ML-based NER for known pattern
 """
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator - see requirements.txt
+    hyperscan = None
+
 from config import PipelineConfig
 from utils.logger import setup_logger, log_with_context
 
 
 logger = setup_logger(__name__)
 
+_DIGIT_RE = re.compile(r'\d')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Digit count a well-formed match of each structured PII type must have
+_EXPECTED_DIGITS = {'cccd': 12, 'phone': 10}
+
+
+@lru_cache(maxsize=8192)
+def _regex_confidence(pii_type: str, matched_text: str) -> float:
+    """
+    Score how well a regex match fits its PII type (1.0 or 0.7).
+    
+    Why cached: The same CCCDs and phone numbers recur across pages and
+    documents (headers, footers, repeated parties), so the digit extraction
+    is done once per distinct value.
+    """
+    expected_length = _EXPECTED_DIGITS.get(pii_type)
+    if expected_length is None:
+        return 1.0  # Assume perfect match for unstructured types
+        
+    digits_only = _NON_DIGIT_RE.sub('', matched_text)
+    return 1.0 if len(digits_only) == expected_length else 0.7  # 0.7: partial match
+
+
+def _collect_hyperscan_hit(pattern_id: int, start: int, end: int, flags: int, hits: set) -> None:
+    """Hyperscan match callback: record which pattern ids matched."""
+    hits.add(pattern_id)
+
 
 @dataclass
 class PIIMatch:
@@ -26,18 +62,29 @@ class PIIMatch:
     
     Why dataclass: Provides clean, type-safe structure for PII matches.
     Makes code more maintainable and self-documenting.
+    
+    Why __slots__: Documents can yield thousands of matches, all pickled
+    back from the pool workers. Slots drop the per-instance __dict__. Only
+    the length of the matched text is kept, never the PII itself, since
+    nothing downstream needs more.
     """
+    __slots__ = ('pii_type', 'value_length', 'confidence', 'bbox', 'page', '_xywh')
+    
     pii_type: str          # Type of PII (cccd, name, dob, etc.)
-    value: str             # The actual PII text
+    value_length: int      # Length of the matched PII text
     confidence: float      # Detection confidence (0-1)
     bbox: List[List[int]]  # Bounding box from OCR [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
     page: int              # Page number (0-indexed)
     
+    def __post_init__(self) -> None:
+        # [x, y, w, h] computed from bbox on first use (see _bbox_to_xyxywh)
+        self._xywh: Optional[List[int]] = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             'type': self.pii_type,
-            'value_length': len(self.value),  # Store length, not actual value for privacy
+            'value_length': self.value_length,  # Store length, not actual value for privacy
             'confidence': round(self.confidence, 3),
             'bbox': self._bbox_to_xyxywh(),
             'page': self.page
@@ -52,23 +99,33 @@ class PIIMatch:
             
         Why this format: Standard bounding box format used in computer vision.
         Makes it compatible with OpenCV drawing functions.
+        
+        Why cached: Both to_dict() and the redactor ask for this, so the
+        corners are reduced once per match. Callers must not mutate the list.
         """
+        if self._xywh is not None:
+            return self._xywh
+            
         if not self.bbox or len(self.bbox) < 4:
-            return [0, 0, 0, 0]
+            self._xywh = [0, 0, 0, 0]
+            return self._xywh
             
-        # Extract all x and y coordinates
-        x_coords = [point[0] for point in self.bbox]
-        y_coords = [point[1] for point in self.bbox]
-        
-        x_min = int(min(x_coords))
-        y_min = int(min(y_coords))
-        x_max = int(max(x_coords))
-        y_max = int(max(y_coords))
-        
-        width = x_max - x_min
-        height = y_max - y_min
-        
-        return [x_min, y_min, width, height]
+        # Single pass over the corners
+        (x_min, y_min), *rest = self.bbox
+        x_max, y_max = x_min, y_min
+        for x, y in rest:
+            if x < x_min:
+                x_min = x
+            elif x > x_max:
+                x_max = x
+            if y < y_min:
+                y_min = y
+            elif y > y_max:
+                y_max = y
+                
+        x_min, y_min = int(x_min), int(y_min)
+        self._xywh = [x_min, y_min, int(x_max) - x_min, int(y_max) - y_min]
+        return self._xywh
 
 
 class PIIDetector:
@@ -81,11 +138,35 @@ class PIIDetector:
     """
     
     def __init__(self):
-        """Initialize the detector with configured patterns."""
-        self.patterns = {
-            pii_type: re.compile(pattern, re.IGNORECASE | re.UNICODE)
-            for pii_type, pattern in PipelineConfig.PII_PATTERNS.items()
-        }
+        """
+        Initialize the detector with the patterns precompiled in config.
+        
+        Why no compile here: PipelineConfig compiles every pattern, the fused
+        screen and the Hyperscan database once, when the module is imported.
+        All detectors in a process share those objects, so creating one costs
+        attribute lookups only. Worker processes (see main._init_worker)
+        compile once on import or inherit the parent's objects under fork.
+        """
+        self.patterns = PipelineConfig.PII_PATTERNS_COMPILED
+        self.finditer_kwargs = PipelineConfig.PII_FINDITER_KWARGS
+        self.screen = PipelineConfig.PII_SCREEN_PATTERN
+        self.keyword_triggers = PipelineConfig.PII_KEYWORD_TRIGGERS
+        self.digit_types = PipelineConfig.PII_DIGIT_TYPES
+        self.min_lengths = PipelineConfig.PII_MIN_LENGTHS
+        self.min_text_length = PipelineConfig.PII_MIN_TEXT_LENGTH
+        self.labels = PipelineConfig.PII_LABELS
+        self.hs_db = PipelineConfig.PII_HS_DB
+        self.page_threads = (
+            PipelineConfig.PII_DETECTION_THREADS if PipelineConfig.PII_PARALLEL_PAGES else 1
+        )
+        # Hyperscan scratch space cannot be shared by concurrent scans, so each
+        # thread scanning pages gets its own (see _hs_scratch)
+        self._local = threading.local()
+        # Screening depends only on the text, and template boilerplate (titles,
+        # clause headings, party labels) recurs on every page and document
+        self._screen_text = lru_cache(maxsize=PipelineConfig.PII_SCREEN_CACHE_SIZE)(
+            self._screen_text
+        )
         logger.info(f"PII Detector initialized with {len(self.patterns)} patterns")
         
     def _calculate_confidence(
@@ -109,26 +190,88 @@ class PIIDetector:
         matter. A perfect regex match on poorly-recognized text is less reliable
         than a perfect match on clear text.
         """
-        # Base confidence from regex match quality
-        regex_confidence = 1.0  # Assume perfect match for now
+        # Base confidence from regex match quality. For structured data
+        # (CCCD, phone), an exact digit count gives full confidence.
+        regex_confidence = _regex_confidence(pii_type, match.group(0))
         
-        # For structured data (CCCD, phone), exact length match increases confidence
-        if pii_type in ['cccd', 'phone']:
-            matched_text = match.group(0)
-            # Remove non-digits
-            digits_only = re.sub(r'\D', '', matched_text)
-            expected_length = 12 if pii_type == 'cccd' else 10
-            
-            if len(digits_only) == expected_length:
-                regex_confidence = 1.0
-            else:
-                regex_confidence = 0.7  # Partial match
-                
         # Combine with OCR confidence (weighted average)
         combined = (regex_confidence * 0.6) + (ocr_confidence * 0.4)
         
         return min(combined, 1.0)
         
+    def _hs_scratch(self):
+        """Return this thread's Hyperscan scratch, allocating it on first use."""
+        scratch = getattr(self._local, 'hs_scratch', None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self.hs_db)
+            self._local.hs_scratch = scratch
+        return scratch
+        
+    def _candidate_types(self, text: str) -> Tuple[str, ...]:
+        """
+        Decide which PII types are worth running the full regex for.
+        
+        Args:
+            text: OCR-extracted text
+            
+        Returns:
+            PII types (in PII_LABELS order) that can possibly match
+            
+        Why: Most OCR regions contain no PII. With Hyperscan, one SIMD pass
+        reports exactly which patterns match. Without it, the fused screen
+        rejects PII-free text in one pass and cheap prerequisites (length,
+        keywords, digits) rule out individual patterns. Exact spans still come
+        from re.
+        """
+        # Most OCR fragments are single short words: too short for any pattern
+        if len(text) < self.min_text_length:
+            return ()
+            
+        return self._screen_text(text)
+        
+    def _screen_text(self, text: str) -> Tuple[str, ...]:
+        """
+        Screen one region's text (memoized per detector, see __init__).
+        
+        Why memoized: A repeated region skips the UTF-8 encode Hyperscan
+        needs as well as the scan itself. The patterns stay str patterns;
+        compiling them as bytes would lose Unicode case folding and \\b for
+        Vietnamese text.
+        """
+        text_length = len(text)
+        
+        if self.hs_db is not None:
+            hits: set = set()
+            self.hs_db.scan(
+                text.encode('utf-8'),
+                match_event_handler=_collect_hyperscan_hit,
+                context=hits,
+                scratch=self._hs_scratch()
+            )
+            return tuple(self.labels[pattern_id] for pattern_id in sorted(hits))
+            
+        # Single-pass rejection: if the fused pattern finds nothing, no
+        # individual pattern can match either.
+        if not self.screen.search(text):
+            return ()
+            
+        lowered = text.lower()
+        has_digit = _DIGIT_RE.search(text) is not None
+        
+        candidates = []
+        for pii_type in self.labels:
+            # Skip patterns whose prerequisites are absent
+            if text_length < self.min_lengths[pii_type]:
+                continue
+            if pii_type in self.digit_types and not has_digit:
+                continue
+            triggers = self.keyword_triggers.get(pii_type)
+            if triggers and not any(trigger in lowered for trigger in triggers):
+                continue
+            candidates.append(pii_type)
+            
+        return tuple(candidates)
+        
     def detect_in_text(
         self, 
         text: str, 
@@ -153,8 +296,9 @@ class PIIDetector:
         """
         matches = []
         
-        for pii_type, pattern in self.patterns.items():
-            for regex_match in pattern.finditer(text):
+        for pii_type in self._candidate_types(text):
+            pattern = self.patterns[pii_type]
+            for regex_match in pattern.finditer(text, **self.finditer_kwargs):
                 confidence = self._calculate_confidence(
                     pii_type, 
                     regex_match, 
@@ -165,7 +309,7 @@ class PIIDetector:
                 if confidence >= 0.5:
                     pii_match = PIIMatch(
                         pii_type=pii_type,
-                        value=regex_match.group(0),
+                        value_length=regex_match.end() - regex_match.start(),
                         confidence=confidence,
                         bbox=bbox,
                         page=page
@@ -196,27 +340,17 @@ class PIIDetector:
             
         Why: Orchestrates PII detection across entire multi-page documents,
         properly tracking page numbers and coordinates.
-        """
-        all_matches = []
         
-        for page_data in ocr_results:
-            page_num = page_data.get('page', 0)
-            ocr_page_results = page_data.get('ocr_results', [])
+        Why threads: When the engine releases the GIL while matching, pages
+        are scanned concurrently. Results keep page order either way.
+        """
+        if self.page_threads > 1 and len(ocr_results) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.page_threads, len(ocr_results))) as executor:
+                page_matches = list(executor.map(self._detect_in_page, ocr_results))
+        else:
+            page_matches = [self._detect_in_page(page_data) for page_data in ocr_results]
             
-            for bbox, text, confidence in ocr_page_results:
-                # Skip low-confidence OCR results
-                if confidence < 0.3:
-                    continue
-                    
-                # Detect PII in this text region
-                pii_matches = self.detect_in_text(
-                    text=text,
-                    bbox=bbox,
-                    ocr_confidence=confidence,
-                    page=page_num
-                )
-                
-                all_matches.extend(pii_matches)
+        all_matches = [match for matches in page_matches for match in matches]
                 
         log_with_context(
             logger, 'info', 'PII detection completed',
@@ -226,6 +360,26 @@ class PIIDetector:
         
         return all_matches
         
+    def _detect_in_page(self, page_data: Dict[str, Any]) -> List[PIIMatch]:
+        """Detect PII in every text region of one page of OCR results."""
+        page_num = page_data.get('page', 0)
+        page_matches = []
+        
+        for bbox, text, confidence in page_data.get('ocr_results', []):
+            # Skip low-confidence OCR results
+            if confidence < 0.3:
+                continue
+                
+            # Detect PII in this text region
+            page_matches.extend(self.detect_in_text(
+                text=text,
+                bbox=bbox,
+                ocr_confidence=confidence,
+                page=page_num
+            ))
+            
+        return page_matches
+        
     def get_pii_statistics(self, matches: List[PIIMatch]) -> Dict[str, int]:
         """
         Get statistics about detected PII.
@@ -9,20 +9,83 @@ the original document structure is preserved while making PII unreadable. This
 is crucial for ML training where document layout matters.
 """
 
-from typing import List, Dict, Any, Tuple
+import queue
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Iterator, TypeVar, Deque
 from pathlib import Path
 import numpy as np
 import cv2
-from pdf2image import convert_from_path
 from PIL import Image
 
 from config import PipelineConfig
 from modules.processing.pii_detector import PIIMatch
 from utils.logger import setup_logger, log_with_context
+from utils.pdf_render import iter_pdf_pages
 
 
 logger = setup_logger(__name__)
 
+T = TypeVar('T')
+
+# Tags for what the prefetch thread puts on its queue
+_ITEM, _ERROR, _DONE = range(3)
+
+
+def _prefetch(items: Iterator[T], depth: int) -> Iterator[T]:
+    """
+    Yield from an iterator that a background thread runs up to `depth` items ahead.
+    
+    Why: Rendering a PDF page (pdfium, via ctypes) releases the GIL, so the
+    next pages render while the caller redacts the current one. The bounded
+    queue caps how many full-resolution pages are held at once. If the
+    consumer stops early, the thread is told to stop and unblocked.
+    Producer exceptions are re-raised in the consumer.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def produce() -> None:
+        try:
+            for item in items:
+                if stop.is_set():
+                    break
+                buffer.put((_ITEM, item))
+        except Exception as e:
+            buffer.put((_ERROR, e))
+        finally:
+            close = getattr(items, 'close', None)
+            if close is not None:
+                close()
+            buffer.put((_DONE, None))
+            
+    thread = threading.Thread(target=produce, name='pdf-render', daemon=True)
+    thread.start()
+    try:
+        while True:
+            tag, value = buffer.get()
+            if tag == _DONE:
+                return
+            if tag == _ERROR:
+                raise value
+            yield value
+    finally:
+        stop.set()
+        # Drain so a producer blocked on a full queue can finish
+        while thread.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+
+
+def _check_write(write: Future, pdf_path: Path) -> None:
+    """Wait for a queued page write and raise if cv2.imwrite reported failure."""
+    if not write.result():
+        raise IOError(f"Failed to write redacted page for {pdf_path.name}")
+
 
 class DocumentRedactor:
     """
@@ -35,101 +98,116 @@ class DocumentRedactor:
     
     def __init__(self):
         """Initialize redactor with configuration settings."""
-        self.redaction_color = PipelineConfig.REDACTION_COLOR
-        self.redaction_thickness = PipelineConfig.REDACTION_THICKNESS
-        self.padding = PipelineConfig.REDACTION_PADDING
+        # Cast once to the page dtype so each box fill is a plain memset,
+        # not a per-call conversion of a Python tuple
+        color = np.array(PipelineConfig.REDACTION_COLOR, dtype=np.uint8)
+        if color.ndim == 0:
+            # A single intensity means the same value on every channel
+            color = np.full(3, color, dtype=np.uint8)
+        elif color.shape != (3,):
+            raise ValueError(
+                f"REDACTION_COLOR must be a BGR triple or a single intensity, "
+                f"got {PipelineConfig.REDACTION_COLOR!r}"
+            )
+        self.redaction_color = color
+        # Luma of the BGR color, so grayscale pages get the matching gray
+        self.redaction_gray = cv2.cvtColor(color.reshape(1, 1, 3), cv2.COLOR_BGR2GRAY)[0, 0]
+        # Opaque fill for pages that carry an alpha channel
+        self.redaction_bgra = np.append(color, np.uint8(255))
+        self.padding = int(PipelineConfig.REDACTION_PADDING)
+        self.png_params = [cv2.IMWRITE_PNG_COMPRESSION, PipelineConfig.REDACTION_PNG_COMPRESSION]
+        # PNG encoding releases the GIL inside OpenCV, so page writes run on
+        # these threads while the next page is rendered and redacted.
+        self._io_pool = ThreadPoolExecutor(max_workers=PipelineConfig.REDACTION_WRITER_THREADS)
         
-    def _draw_redaction_box(
-        self, 
-        image: np.ndarray, 
-        bbox: List[int]
-    ) -> np.ndarray:
+    def close(self) -> None:
         """
-        Draw a black box over a region of the image.
+        Shut down the page writer threads.
         
-        Args:
-            image: Image as numpy array
-            bbox: Bounding box as [x, y, width, height]
-            
-        Returns:
-            Modified image with redaction box
-            
-        Why padding: Adding padding around detected text ensures we don't
-        miss any pixels at the edges due to OCR bounding box inaccuracies.
+        Why: Each redactor owns a thread pool; short-lived redactors must
+        release it rather than leave idle threads behind until exit.
         """
-        x, y, w, h = bbox
+        self._io_pool.shutdown(wait=True)
         
-        # Apply padding
-        x = max(0, x - self.padding)
-        y = max(0, y - self.padding)
-        w = w + (2 * self.padding)
-        h = h + (2 * self.padding)
+    def __enter__(self) -> "DocumentRedactor":
+        return self
         
-        # Ensure we don't go beyond image boundaries
-        img_height, img_width = image.shape[:2]
-        w = min(w, img_width - x)
-        h = min(h, img_height - y)
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
         
-        # Draw filled rectangle
-        cv2.rectangle(
-            image,
-            (x, y),
-            (x + w, y + h),
-            self.redaction_color,
-            self.redaction_thickness
-        )
+    def _fill_for(self, image: np.ndarray) -> np.ndarray:
+        """
+        Return the redaction fill matching an image's channel count.
         
-        return image
+        Why: Assigning a 3-value color to a 4-channel (BGRA) page fails, and
+        a grayscale page needs the gray equivalent, not the blue channel.
+        """
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        if channels == 1:
+            return self.redaction_gray
+        if channels == 3:
+            return self.redaction_color
+        if channels == 4:
+            return self.redaction_bgra
+        raise ValueError(f"Cannot redact an image with {channels} channels")
         
     def redact_image(
         self, 
         image: np.ndarray, 
-        pii_matches: List[PIIMatch],
-        page_num: int = 0
+        page_matches: List[PIIMatch],
+        page_num: int = 0,
+        scale: float = 1.0
     ) -> Tuple[np.ndarray, int]:
         """
         Redact PII from a single image.
         
         Args:
             image: Image as numpy array
-            pii_matches: List of PII matches to redact
+            page_matches: PII matches to redact, all on this page (callers
+                partition a document's matches by page once up front)
             page_num: Page number (for multi-page documents)
+            scale: Factor from match bbox coordinates to this image's pixels
             
         Returns:
-            Tuple of (redacted_image, redaction_count)
+            Tuple of (redacted_image, redaction_count). When there is nothing
+            to redact, the input array itself is returned (not a copy).
             
         Why return count: Tracking redaction count helps validate that
         the redaction process is working correctly.
+        
+        Why padding: Adding padding around detected text ensures we don't
+        miss any pixels at the edges due to OCR bounding box inaccuracies.
+        
+        Why no copy for clean pages: Most pages carry no PII, and copying a
+        300 DPI page is a ~25MB memcpy that would only be written out unchanged.
         """
-        redacted_image = image.copy()
-        redaction_count = 0
+        redacted_image = image.copy() if page_matches else image
+        redaction_count = len(page_matches)
         
-        for match in pii_matches:
-            # Only redact matches from this page
-            if match.page != page_num:
-                continue
-                
-            try:
-                bbox = match._bbox_to_xyxywh()
-                redacted_image = self._draw_redaction_box(redacted_image, bbox)
-                redaction_count += 1
+        if page_matches:
+            # Pad and clip every box at once, then fill each as a plain slice
+            # assignment (a memset in NumPy's C core, no per-call cv2 overhead
+            # or full-page mask). Ends are inclusive, like a filled
+            # cv2.rectangle.
+            boxes = np.array([match._bbox_to_xyxywh() for match in page_matches], dtype=np.int64)
+            if scale != 1.0:
+                boxes = np.rint(boxes * scale).astype(np.int64)
+            img_height, img_width = image.shape[:2]
+            x0 = np.maximum(boxes[:, 0] - self.padding, 0)
+            y0 = np.maximum(boxes[:, 1] - self.padding, 0)
+            x1 = np.minimum(x0 + boxes[:, 2] + 2 * self.padding, img_width)
+            y1 = np.minimum(y0 + boxes[:, 3] + 2 * self.padding, img_height)
+            fill = self._fill_for(redacted_image)
+            
+            for match, left, top, right, bottom in zip(page_matches, x0, y0, x1, y1):
+                redacted_image[top:bottom + 1, left:right + 1] = fill
                 
                 log_with_context(
                     logger, 'debug', 'Applied redaction',
                     pii_type=match.pii_type,
                     page=page_num,
-                    bbox=bbox
-                )
-                
-            except Exception as e:
-                # Log but continue - don't let one bad redaction stop the whole process
-                log_with_context(
-                    logger, 'warning', 'Failed to apply redaction',
-                    pii_type=match.pii_type,
-                    page=page_num,
-                    error=str(e)
+                    bbox=match._bbox_to_xyxywh()
                 )
-                continue
                 
         log_with_context(
             logger, 'info', 'Image redaction completed',
@@ -143,7 +221,8 @@ class DocumentRedactor:
         self, 
         pdf_path: Path, 
         pii_matches: List[PIIMatch],
-        output_path: Path
+        output_path: Path,
+        dpi: int = PipelineConfig.PDF_RENDER_DPI
     ) -> Dict[str, Any]:
         """
         Redact PII from a PDF document.
@@ -152,6 +231,7 @@ class DocumentRedactor:
             pdf_path: Path to input PDF
             pii_matches: List of PII matches to redact
             output_path: Path to save redacted PDF
+            dpi: Resolution of the redacted page images
             
         Returns:
             Dictionary with redaction metadata
@@ -159,59 +239,77 @@ class DocumentRedactor:
         Why PDF handling: PDFs need special handling - convert to images,
         redact, then save as images or reassemble into PDF. We save as
         images for simplicity in this pipeline.
+        
+        Why render at the output DPI: Rendering cost grows with the square
+        of the DPI, so a lower-resolution output is rendered directly at that
+        resolution rather than rendered at PDF_RENDER_DPI and downsampled.
+        Match boxes (in PDF_RENDER_DPI pixels) are scaled to it instead.
         """
         logger.info(f"Redacting PDF: {pdf_path.name}")
         
         try:
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=300)
+            # Three-stage pipeline: a background thread renders pages a few
+            # ahead, this thread redacts them, and the I/O pool encodes and
+            # writes them. At most REDACTION_RENDER_AHEAD rendered and
+            # REDACTION_WRITER_THREADS redacted pages are held in memory.
+            page_count, pages = iter_pdf_pages(pdf_path, dpi)
+            pages = _prefetch(pages, PipelineConfig.REDACTION_RENDER_AHEAD)
+            box_scale = dpi / PipelineConfig.PDF_RENDER_DPI
+            
+            # Partition matches by page once instead of filtering the whole
+            # list again for every page
+            matches_by_page: Dict[int, List[PIIMatch]] = defaultdict(list)
+            for match in pii_matches:
+                matches_by_page[match.page].append(match)
             
             total_redactions = 0
-            redacted_images = []
+            saved_files = []
+            pending_writes: Deque[Future] = deque()
+            base_name = output_path.stem
             
-            for page_num, image in enumerate(images):
-                # Convert PIL Image to numpy array
-                img_array = np.array(image)
-                
+            for page_num, img_array in enumerate(pages):
                 # Redact this page
                 redacted_img, redaction_count = self.redact_image(
                     img_array, 
-                    pii_matches, 
-                    page_num
+                    matches_by_page.get(page_num, []), 
+                    page_num,
+                    box_scale
                 )
-                
-                redacted_images.append(redacted_img)
                 total_redactions += redaction_count
                 
-            # Save redacted version
-            # For multi-page PDFs, we save as PNG images (page_0.png, page_1.png, etc.)
-            # In production, you might want to reassemble into a PDF
-            if len(redacted_images) == 1:
-                # Single page - save as single image
-                output_img_path = output_path.with_suffix('.png')
-                cv2.imwrite(str(output_img_path), redacted_images[0])
-                saved_files = [output_img_path.name]
-            else:
-                # Multi-page - save each page
-                saved_files = []
-                base_name = output_path.stem
-                
-                for page_num, redacted_img in enumerate(redacted_images):
+                # Save redacted version
+                # Single page - save as single image; multi-page PDFs are saved
+                # as PNG images (page_0.png, page_1.png, etc.)
+                # In production, you might want to reassemble into a PDF
+                if page_count == 1:
+                    page_output = output_path.with_suffix('.png')
+                else:
                     page_output = output_path.parent / f"{base_name}_page_{page_num}.png"
-                    cv2.imwrite(str(page_output), redacted_img)
-                    saved_files.append(page_output.name)
+                # Each pending write holds a full page at the output DPI, so
+                # wait on the oldest before queueing another. Otherwise a slow
+                # encoder lets a whole document pile up in memory.
+                if len(pending_writes) >= PipelineConfig.REDACTION_WRITER_THREADS:
+                    _check_write(pending_writes.popleft(), pdf_path)
+                pending_writes.append(self._io_pool.submit(
+                    cv2.imwrite, str(page_output), redacted_img, self.png_params
+                ))
+                saved_files.append(page_output.name)
+                
+            # Every page must be on disk before we report success
+            for write in pending_writes:
+                _check_write(write, pdf_path)
                     
             log_with_context(
                 logger, 'info', 'PDF redaction completed',
                 filename=pdf_path.name,
-                pages=len(redacted_images),
+                pages=page_count,
                 total_redactions=total_redactions
             )
             
             return {
                 'original_file': pdf_path.name,
                 'redacted_files': saved_files,
-                'pages': len(redacted_images),
+                'pages': page_count,
                 'total_redactions': total_redactions
             }
             
@@ -253,12 +351,12 @@ class DocumentRedactor:
             # Redact
             redacted_image, redaction_count = self.redact_image(
                 image, 
-                pii_matches, 
+                [match for match in pii_matches if match.page == 0], 
                 page_num=0
             )
             
             # Save
-            cv2.imwrite(str(output_path), redacted_image)
+            cv2.imwrite(str(output_path), redacted_image, self.png_params)
             
             log_with_context(
                 logger, 'info', 'Image redaction completed',
@@ -301,14 +399,13 @@ def redact_document(
     Why: Provides a simple interface that automatically handles different
     file types without the caller needing to know the details.
     """
-    redactor = DocumentRedactor()
-    
     # Determine output path
     output_path = output_dir / f"redacted_{document_path.name}"
     
-    # Process based on file type
-    if document_path.suffix.lower() == '.pdf':
-        return redactor.redact_pdf(document_path, pii_matches, output_path)
-    else:
-        # Assume image
-        return redactor.redact_image_file(document_path, pii_matches, output_path)
+    with DocumentRedactor() as redactor:
+        # Process based on file type
+        if document_path.suffix.lower() == '.pdf':
+            return redactor.redact_pdf(document_path, pii_matches, output_path)
+        else:
+            # Assume image
+            return redactor.redact_image_file(document_path, pii_matches, output_path)
@@ -12,18 +12,38 @@ Why metadata: Comprehensive metadata enables:
 """
 
 import json
+import time
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-from datetime import datetime
+
+import orjson
 
 from config import PipelineConfig
 from modules.processing.pii_detector import PIIMatch
-from utils.logger import setup_logger, log_with_context
+from utils.logger import setup_logger, log_with_context, utc_timestamp
 
 
 logger = setup_logger(__name__)
 
 
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO 8601 string with millisecond precision and 'Z'.
+    
+    Why: Called for every added document; utc_timestamp formats only the
+    milliseconds per call and reuses the cached per-second prefix.
+    """
+    return utc_timestamp(time.time(), digits=3)
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback: write PIIMatch objects in their to_dict() form."""
+    if isinstance(obj, PIIMatch):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 class MetadataManager:
     """
     Manages metadata collection and persistence for the entire pipeline.
@@ -48,6 +68,14 @@ class MetadataManager:
             "processing_stats": {},
             "pipeline_version": "1.0.0"
         }
+        # filename -> position in metadata["documents"], so per-document
+        # updates are O(1) lookups instead of a scan over every document
+        self._doc_index: Dict[str, int] = {}
+        # Running totals behind calculate_aggregate_stats, kept in step with
+        # every document add/update instead of recounted on each call
+        self._total_pii = 0
+        self._pii_by_type: Counter = Counter()
+        self._docs_by_type: Counter = Counter()
         
     def initialize_dataset_info(self, **kwargs) -> None:
         """
@@ -60,7 +88,7 @@ class MetadataManager:
         useful for understanding dataset provenance and characteristics.
         """
         self.metadata["dataset_info"] = {
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": _utc_timestamp(),
             "total_files": 0,  # Will be updated as documents are added
             **kwargs
         }
@@ -80,7 +108,7 @@ class MetadataManager:
         Expected fields:
             - filename: str
             - doc_type: str
-            - redacted_boxes: List[Dict]
+            - redacted_boxes: List[Dict] or List[PIIMatch]
             - processing_timestamp: str (ISO format)
             - any other document-specific metadata
         """
@@ -91,9 +119,14 @@ class MetadataManager:
             
         # Add processing timestamp if not present
         if "processing_timestamp" not in document_metadata:
-            document_metadata["processing_timestamp"] = datetime.utcnow().isoformat() + "Z"
+            document_metadata["processing_timestamp"] = _utc_timestamp()
             
+        # setdefault: on a duplicate filename the first entry keeps receiving
+        # updates, as with the old first-match scan
+        self._doc_index.setdefault(document_metadata["filename"], len(self.metadata["documents"]))
         self.metadata["documents"].append(document_metadata)
+        self._docs_by_type[document_metadata.get("doc_type", "unknown")] += 1
+        self._count_pii(document_metadata, 1)
         
         # Update total count
         self.metadata["dataset_info"]["total_files"] = len(self.metadata["documents"])
@@ -120,21 +153,18 @@ class MetadataManager:
         enabling validation and analysis of redaction quality.
         """
         # Find the document
-        doc_metadata = None
-        for doc in self.metadata["documents"]:
-            if doc.get("filename") == filename:
-                doc_metadata = doc
-                break
-                
-        if not doc_metadata:
+        idx = self._doc_index.get(filename)
+        if idx is None:
             logger.warning(f"Document not found in metadata: {filename}")
             return
+        doc_metadata = self.metadata["documents"][idx]
+        # Any earlier PII results for this document are replaced below
+        self._count_pii(doc_metadata, -1)
             
-        # Convert PIIMatch objects to dictionaries
-        redacted_boxes = [match.to_dict() for match in pii_matches]
-        
-        doc_metadata["redacted_boxes"] = redacted_boxes
-        doc_metadata["pii_count"] = len(redacted_boxes)
+        # Kept as PIIMatch objects (slotted, smaller than their dicts) and
+        # converted with to_dict() only when save() serializes them
+        doc_metadata["redacted_boxes"] = list(pii_matches)
+        doc_metadata["pii_count"] = len(pii_matches)
         
         # Calculate PII statistics for this document
         pii_stats = {}
@@ -143,6 +173,7 @@ class MetadataManager:
             pii_stats[pii_type] = pii_stats.get(pii_type, 0) + 1
             
         doc_metadata["pii_statistics"] = pii_stats
+        self._count_pii(doc_metadata, 1)
         
         log_with_context(
             logger, 'debug', 'PII metadata added to document',
@@ -150,6 +181,27 @@ class MetadataManager:
             pii_count=len(pii_matches)
         )
         
+    def add_pii_matches_bulk(
+        self,
+        pii_by_file: Dict[str, List[PIIMatch]]
+    ) -> None:
+        """
+        Add PII detection results for many documents at once.
+        
+        Args:
+            pii_by_file: Mapping of document filename to its detected PII matches
+            
+        Why: Lets the processing phase collect results and update metadata
+        in one call after the loop, instead of once per processed file.
+        """
+        for filename, pii_matches in pii_by_file.items():
+            self.add_pii_matches_to_document(filename, pii_matches)
+            
+        log_with_context(
+            logger, 'debug', 'Bulk PII metadata added',
+            documents=len(pii_by_file)
+        )
+        
     def update_processing_stats(self, stats: Dict[str, Any]) -> None:
         """
         Update pipeline-level processing statistics.
@@ -180,29 +232,19 @@ class MetadataManager:
             
         Why: Provides overview metrics without requiring external analysis.
         Useful for quick validation that the pipeline ran successfully.
+        
+        Why constant time: The totals are maintained incrementally by
+        add_document/add_pii_matches_to_document (and rebuilt by load()), so
+        save() and get_summary() don't each walk every document.
         """
         stats = {
             "total_documents": len(self.metadata["documents"]),
-            "total_pii_detected": 0,
-            "pii_by_type": {},
-            "documents_by_type": {},
+            "total_pii_detected": self._total_pii,
+            "pii_by_type": {k: v for k, v in self._pii_by_type.items() if v},
+            "documents_by_type": {k: v for k, v in self._docs_by_type.items() if v},
             "avg_pii_per_document": 0.0
         }
         
-        for doc in self.metadata["documents"]:
-            # Count PII
-            pii_count = doc.get("pii_count", 0)
-            stats["total_pii_detected"] += pii_count
-            
-            # Aggregate by PII type
-            pii_stats = doc.get("pii_statistics", {})
-            for pii_type, count in pii_stats.items():
-                stats["pii_by_type"][pii_type] = stats["pii_by_type"].get(pii_type, 0) + count
-                
-            # Count documents by type
-            doc_type = doc.get("doc_type", "unknown")
-            stats["documents_by_type"][doc_type] = stats["documents_by_type"].get(doc_type, 0) + 1
-            
         # Calculate average
         if stats["total_documents"] > 0:
             stats["avg_pii_per_document"] = round(
@@ -227,14 +269,26 @@ class MetadataManager:
             self.metadata["aggregate_statistics"] = aggregate_stats
             
             # Add final save timestamp
-            self.metadata["dataset_info"]["saved_at"] = datetime.utcnow().isoformat() + "Z"
+            self.metadata["dataset_info"]["saved_at"] = _utc_timestamp()
             
             # Ensure output directory exists
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write JSON with pretty formatting
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, ensure_ascii=False, indent=2)
+            # Write JSON with pretty formatting. orjson encodes straight to
+            # UTF-8 bytes (non-ASCII unescaped, like ensure_ascii=False) several
+            # times faster than json.dump for this dict/list-heavy tree.
+            # PASSTHROUGH_DATACLASS routes PIIMatch through _json_default so
+            # it keeps the to_dict() schema rather than orjson's field dump.
+            # SERIALIZE_NUMPY covers NumPy scalars (e.g. confidences derived
+            # from EasyOCR scores), which json.dump accepted as float subclasses.
+            self.output_path.write_bytes(orjson.dumps(
+                self.metadata,
+                default=_json_default,
+                option=(
+                    orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS |
+                    orjson.OPT_SERIALIZE_NUMPY
+                )
+            ))
                 
             log_with_context(
                 logger, 'info', 'Metadata saved',
@@ -269,8 +323,8 @@ class MetadataManager:
             return False
             
         try:
-            with open(self.output_path, 'r', encoding='utf-8') as f:
-                self.metadata = json.load(f)
+            self.metadata = orjson.loads(self.output_path.read_bytes())
+            self._rebuild_indexes()
                 
             log_with_context(
                 logger, 'info', 'Metadata loaded',
@@ -288,6 +342,26 @@ class MetadataManager:
             )
             raise
             
+    def _count_pii(self, doc: Dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a document's PII from the running totals."""
+        self._total_pii += sign * doc.get("pii_count", 0)
+        for pii_type, count in doc.get("pii_statistics", {}).items():
+            self._pii_by_type[pii_type] += sign * count
+            
+    def _rebuild_indexes(self) -> None:
+        """Recompute the filename index and running totals from metadata["documents"]."""
+        self._doc_index = {}
+        self._total_pii = 0
+        self._pii_by_type = Counter()
+        self._docs_by_type = Counter()
+        for idx, doc in enumerate(self.metadata.get("documents", [])):
+            filename = doc.get("filename")
+            # First occurrence wins, matching the old linear scan
+            if filename is not None and filename not in self._doc_index:
+                self._doc_index[filename] = idx
+            self._docs_by_type[doc.get("doc_type", "unknown")] += 1
+            self._count_pii(doc, 1)
+                
     def get_summary(self) -> str:
         """
         Get a human-readable summary of the metadata.
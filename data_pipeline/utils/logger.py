@@ -4,16 +4,90 @@ Structured Logging Module
 This module provides a centralized logging configuration for the entire pipeline.
 Why: Structured logging (JSON format) enables better log aggregation, monitoring,
 and debugging in production environments. It's searchable and machine-parseable.
+
+Why a queue: Loggers hand records to a QueueHandler and a background listener
+thread formats and writes them. A log call therefore never performs stdout or
+file I/O on the caller's thread, which makes the same loggers safe to use from
+asyncio code (the crawler) without blocking the event loop.
 """
 
+import atexit
+import copy
+import itertools
 import logging
-import json
+import multiprocessing.util
+import operator
+import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+
 from config import PipelineConfig
 
+# NumPy scalars (e.g. OCR confidences) serialize as numbers
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# log_with_context level names -> (numeric level, unbound Logger method)
+_LEVELS: Dict[str, Tuple[int, Callable[..., None]]] = {
+    'debug': (logging.DEBUG, logging.Logger.debug),
+    'info': (logging.INFO, logging.Logger.info),
+    'warning': (logging.WARNING, logging.Logger.warning),
+    'error': (logging.ERROR, logging.Logger.error),
+    'critical': (logging.CRITICAL, logging.Logger.critical),
+}
+
+# Per-thread `extra` mapping reused by log_with_context (see there)
+_extra_slot = threading.local()
+
+# LogRecord attributes copied into every JSON record, fetched in one C call
+_RECORD_FIELDS = operator.attrgetter('levelname', 'name', 'module', 'funcName', 'lineno')
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    """
+    Same result as record.getMessage(), without the call for plain messages.
+    
+    Why: Almost every call logs a literal string with no %-args, where
+    getMessage() would only return str(msg).
+    """
+    msg = record.msg
+    if record.args or not isinstance(msg, str):
+        return record.getMessage()
+    return msg
+
+
+@lru_cache(maxsize=1)
+def _utc_second_prefix(epoch_second: int) -> str:
+    """Format one UTC second as 'YYYY-MM-DDTHH:MM:SS' (cached for the current second)."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(epoch_second))
+
+
+def utc_timestamp(epoch: float, digits: int = 6) -> str:
+    """
+    Format a Unix time as an ISO 8601 UTC string with a trailing 'Z'.
+    
+    Args:
+        epoch: Seconds since the epoch (e.g. time.time() or LogRecord.created)
+        digits: Fractional-second digits (6 = microseconds, 3 = milliseconds)
+        
+    Returns:
+        Timestamp such as '2024-01-31T12:00:00.123456Z'
+        
+    Why: Used for every log record and metadata entry. Records within the
+    same second reuse the cached strftime prefix, so only the fraction is
+    formatted per call; no datetime object is built.
+    """
+    epoch_second = int(epoch)
+    fraction = int((epoch - epoch_second) * 10 ** digits)
+    return f"{_utc_second_prefix(epoch_second)}.{fraction:0{digits}d}Z"
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -21,8 +95,18 @@ class JSONFormatter(logging.Formatter):
     
     Why: JSON logs are easily parsed by log aggregation tools (ELK, Splunk, CloudWatch).
     They preserve data types and make it simple to filter/search by specific fields.
+    
+    Why orjson: Every log record is serialized here. orjson encodes in C,
+    several times faster than json.dumps.
+    
+    Why cache on the record: The console and file handlers of a sink share
+    this formatter and receive the same record, so the second handler
+    reuses the first one's output instead of serializing it again.
     """
     
+    # LogRecord attribute holding (formatter, serialized line as UTF-8 bytes)
+    _CACHE_ATTR = "_json_formatted"
+    
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON string.
@@ -33,25 +117,46 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
+        return self.format_bytes(record).decode('utf-8')
+        
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """
+        Format log record as a UTF-8 encoded JSON line (without newline).
+        
+        Why: orjson produces UTF-8 bytes. The pipeline's handlers write
+        these bytes directly, skipping a decode to str and a re-encode.
+        """
+        cached = record.__dict__.get(self._CACHE_ATTR)
+        if cached is not None and cached[0] is self:
+            return cached[1]
+            
+        level, name, module, function, line = _RECORD_FIELDS(record)
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
+            # The time the record was created, not when it is formatted
+            "timestamp": utc_timestamp(record.created),
+            "level": level,
+            "logger": name,
+            "message": _record_message(record),
+            "module": module,
+            "function": function,
+            "line": line,
         }
         
-        # Add exception info if present
+        # Add exception info if present. record.exc_text is logging's own memo
+        # for the formatted traceback, so it is rendered once per record.
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
             
         # Add extra fields if provided
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
             
-        return json.dumps(log_data, ensure_ascii=False)
+        # Unknown context types fall back to str() rather than failing the record
+        formatted = orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS)
+        setattr(record, self._CACHE_ATTR, (self, formatted))
+        return formatted
 
 
 class TextFormatter(logging.Formatter):
@@ -60,6 +165,10 @@ class TextFormatter(logging.Formatter):
     
     Why: While JSON is great for production, human-readable logs are easier
     to scan during local development and debugging.
+    
+    Why a custom format(): The layout is fixed, so it is written as one
+    f-string instead of running the %-style template over the record's
+    __dict__ on every record.
     """
     
     def __init__(self):
@@ -67,6 +176,282 @@ class TextFormatter(logging.Formatter):
             fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        
+    def format(self, record: logging.LogRecord) -> str:
+        """Format as 'asctime - name - levelname - message' (+ traceback, stack)."""
+        text = (
+            f"{self.formatTime(record, self.datefmt)} - {record.name} - "
+            f"{record.levelname} - {_record_message(record)}"
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            text = f"{text}\n{record.exc_text}"
+        if record.stack_info:
+            text = f"{text}\n{self.formatStack(record.stack_info)}"
+        return text
+
+
+# Formatters are stateless, so every sink shares one instance per format
+_JSON_FORMATTER = JSONFormatter()
+_TEXT_FORMATTER = TextFormatter()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Pass only every n-th DEBUG record; other levels always pass.
+    
+    Why: DEBUG logs fire inside per-region and per-box loops. When debug
+    logging is on for a large run, sampling keeps the volume (and the
+    queueing/formatting cost) proportional to 1/n while still showing
+    what the loops are doing.
+    """
+    
+    def __init__(self, n: int):
+        super().__init__()
+        self.n = n
+        self._counter = itertools.count()
+        
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or next(self._counter) % self.n == 0
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands records to the listener's handlers unformatted.
+    
+    Why: The stdlib prepare() formats the record into its message and drops
+    exc_info, so JSONFormatter would lose its separate "exception" field.
+    Our own formatters run on the listener thread, so only the message
+    args are merged here (they may be mutated once the call returns).
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = _record_message(record)
+        record.args = None
+        return record
+
+
+def _encode_line(handler: logging.Handler, record: logging.LogRecord) -> bytes:
+    """
+    Format a record for a handler as one UTF-8 encoded line.
+    
+    Why: JSONFormatter already produces UTF-8 bytes, so they are written
+    as-is; other formatters' text is encoded here, once.
+    """
+    format_bytes = getattr(handler.formatter, 'format_bytes', None)
+    if format_bytes is not None:
+        return format_bytes(record) + b"\n"
+    return (handler.format(record) + "\n").encode('utf-8')
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    Binary FileHandler with a large write buffer that is not flushed per record.
+    
+    Why: FileHandler flushes after every record, one write() syscall per
+    log line. Here lines accumulate in a LOG_FILE_BUFFER_SIZE buffer and
+    are flushed when the listener drains its queue (see _FlushingQueueListener)
+    or immediately for ERROR and above. The file is opened in binary
+    mode and lines are written as UTF-8 bytes (see _encode_line).
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, 'ab', buffering=PipelineConfig.LOG_FILE_BUFFER_SIZE)
+        
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(_encode_line(self, record))
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _StdoutBytesHandler(logging.StreamHandler):
+    """
+    stdout handler that writes UTF-8 bytes to sys.stdout's binary buffer.
+    
+    Why: StreamHandler writes text through sys.stdout's TextIOWrapper (an
+    encoder pass per line) and flushes after every record. Lines here go to
+    the underlying buffer as UTF-8 and are flushed with the file handler
+    when the listener goes idle, or immediately for ERROR and above. On a
+    Windows console the binary layer also expects UTF-8, so Vietnamese text
+    still displays correctly.
+    """
+    
+    def __init__(self):
+        super().__init__(sys.stdout)
+        
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            buffer = getattr(self.stream, 'buffer', None)
+            if buffer is None:
+                # stdout replaced by a text-only stream (IDE, test capture)
+                self.stream.write(self.format(record) + self.terminator)
+            else:
+                buffer.write(_encode_line(self, record))
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty."""
+    
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        # Caught up: nothing more to batch, so make the output visible now
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+    def stop(self) -> None:
+        """
+        Drain the queue, then flush and close every handler.
+
+        Why: The stop sentinel is still queued while the last records are
+        handled, so the idle flush never fires for them. Pool workers leave
+        through os._exit(), where logging.shutdown() does not run either.
+        """
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+            # Leave stdout itself open; only release our file handles
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+
+
+# One queue + background listener per (format, file) sink, shared by every
+# logger configured with those settings
+_sinks: Dict[Tuple[str, Optional[Path]], Tuple[QueueHandler, _FlushingQueueListener]] = {}
+_sinks_lock = threading.Lock()
+
+
+def _get_sink(log_format: str, log_file: Optional[Path]) -> QueueHandler:
+    """
+    Return the queue handler for a sink, starting its listener on first use.
+    
+    Why: Console and file writes happen on the listener's background
+    thread, so a log call only costs a queue put on the caller's thread.
+    """
+    key = (log_format, log_file)
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is None:
+            # Choose formatter
+            formatter = _JSON_FORMATTER if log_format == "json" else _TEXT_FORMATTER
+            
+            # Handlers are left at NOTSET: the logger level is the only gate.
+            # Give a handler its own level only to route levels asymmetrically.
+            
+            # Console handler (stdout)
+            console_handler = _StdoutBytesHandler()
+            console_handler.setFormatter(formatter)
+            handlers = [console_handler]
+            
+            # File handler (if log file specified). Sinks are built once per
+            # (format, file), so this mkdir runs once per process, not once
+            # per setup_logger call.
+            if log_file:
+                log_file.parent.mkdir(parents=True, exist_ok=True)
+                file_handler = _BufferedFileHandler(log_file, encoding='utf-8')
+                file_handler.setFormatter(formatter)
+                handlers.append(file_handler)
+                
+            queue_handler = _RecordQueueHandler(queue.SimpleQueue())
+            # Filtering on the queue handler drops sampled-out records on the
+            # caller's thread, before they are queued or formatted
+            if PipelineConfig.LOG_DEBUG_SAMPLE_N > 1:
+                queue_handler.addFilter(SamplingFilter(PipelineConfig.LOG_DEBUG_SAMPLE_N))
+            listener = _FlushingQueueListener(
+                queue_handler.queue, *handlers, respect_handler_level=True
+            )
+            listener.start()
+            sink = _sinks[key] = (queue_handler, listener)
+            
+    return sink[0]
+
+
+def stop_log_listeners() -> None:
+    """
+    Write out every queued record and stop the background listeners.
+    
+    Why: Registered with atexit so records still queued at interpreter exit
+    are not lost; see also init_process_logging for pool workers.
+    """
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+        _sinks.clear()
+    for _, listener in sinks:
+        listener.stop()
+
+
+def init_process_logging() -> None:
+    """
+    Make a multiprocessing worker flush its queued log records on exit.
+    
+    Why: Pool workers end with os._exit(), which skips atexit. Call this from
+    the pool initializer so multiprocessing's own exit hook drains the queue.
+    """
+    multiprocessing.util.Finalize(None, stop_log_listeners, exitpriority=0)
+
+
+def _flush_before_fork() -> None:
+    """
+    Flush every sink handler and hold its lock across fork().
+    
+    Why: A child inherits the parent's unflushed file buffer and would write
+    those lines a second time. Holding the locks keeps the listener thread
+    from refilling a buffer between the flush and the fork.
+    """
+    for _, listener in list(_sinks.values()):
+        for handler in listener.handlers:
+            handler.acquire()
+            handler.flush()
+
+
+def _release_after_fork_in_parent() -> None:
+    """Release the handler locks taken by _flush_before_fork."""
+    for _, listener in list(_sinks.values()):
+        for handler in listener.handlers:
+            handler.release()
+
+
+def _restart_listeners_after_fork() -> None:
+    """
+    Give a forked child fresh queues and listener threads.
+    
+    Why: Only the forking thread survives fork(), so the inherited listeners
+    have no thread behind them. Their queues may also have been copied
+    mid-operation, so each sink gets a new queue as well.
+    """
+    global _sinks_lock
+    _sinks_lock = threading.Lock()
+    for key, (queue_handler, old_listener) in list(_sinks.items()):
+        queue_handler.queue = queue.SimpleQueue()
+        listener = _FlushingQueueListener(
+            queue_handler.queue, *old_listener.handlers, respect_handler_level=True
+        )
+        listener.start()
+        _sinks[key] = (queue_handler, listener)
+
+
+atexit.register(stop_log_listeners)
+
+# setup_logger results by (name, level, format, file) -> (logger, numeric level)
+_configured_loggers: Dict[Tuple[str, str, str, Optional[Path]], Tuple[logging.Logger, int]] = {}
+if hasattr(os, 'register_at_fork'):
+    # The child's copies of the handler locks are re-created by logging itself
+    os.register_at_fork(
+        before=_flush_before_fork,
+        after_in_parent=_release_after_fork_in_parent,
+        after_in_child=_restart_listeners_after_fork
+    )
 
 
 def setup_logger(
@@ -89,6 +474,15 @@ def setup_logger(
         
     Why: Centralized logger setup ensures consistent configuration across all modules.
     Allows per-module loggers while maintaining uniform formatting and output.
+    Loggers only enqueue records; the actual writes happen on a background
+    listener thread shared per sink (see _get_sink).
+    
+    Why not per-module handlers: Every logger configured with the same
+    format and file gets the *same* QueueHandler, so the whole pipeline
+    shares one handler lock, one stdout stream and one open log file.
+    Handlers stay on the named loggers rather than the root, so records
+    from third-party libraries (Playwright, EasyOCR, PIL) are not pulled
+    into pipeline.log.
     
     Example:
         >>> logger = setup_logger(__name__)
@@ -99,30 +493,27 @@ def setup_logger(
     log_format = log_format or PipelineConfig.LOG_FORMAT
     log_file = log_file or PipelineConfig.LOG_FILE
     
+    # Same request as before: the handlers are in place, only re-apply the
+    # level in case another call for this name changed it meanwhile
+    key = (name, log_level, log_format, log_file)
+    cached = _configured_loggers.get(key)
+    if cached is not None:
+        logger, numeric_level = cached
+        if logger.level != numeric_level:
+            logger.setLevel(numeric_level)
+        return logger
+    
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
+    numeric_level = getattr(logging, log_level.upper())
+    logger.setLevel(numeric_level)
+    _configured_loggers[key] = (logger, numeric_level)
     
     # Prevent duplicate handlers
     if logger.handlers:
         return logger
     
-    # Choose formatter
-    formatter = JSONFormatter() if log_format == "json" else TextFormatter()
-    
-    # Console handler (stdout)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler (if log file specified)
-    if log_file:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    logger.addHandler(_get_sink(log_format, log_file))
     
     return logger
 
@@ -144,5 +535,30 @@ def log_with_context(logger: logging.Logger, level: str, message: str, **context
         >>> log_with_context(logger, 'info', 'File processed', 
         ...                  filename='doc.pdf', page_count=5)
     """
-    log_func = getattr(logger, level.lower())
-    log_func(message, extra={"extra_fields": context})
+    # One dict lookup yields both the level for the guard and the method to
+    # call, instead of getattr on the logging module and on the logger
+    numeric_level, log_method = _LEVELS[level.lower()]
+    
+    # Bail out before building the record when this level is filtered anyway
+    if not logger.isEnabledFor(numeric_level):
+        return
+        
+    # Reuse this thread's {"extra_fields": ...} wrapper instead of allocating
+    # one per call. Safe because Logger.makeRecord copies the values out of
+    # `extra` into the record before the logging call returns.
+    extra = getattr(_extra_slot, 'extra', None)
+    if extra is None:
+        extra = _extra_slot.extra = {"extra_fields": None}
+        if __debug__:
+            # Check the reuse invariant once per thread: a record built with
+            # this wrapper must not hold a reference to the wrapper itself
+            probe = logger.makeRecord(
+                logger.name, numeric_level, '', 0, message, None, None, extra=extra
+            )
+            assert all(value is not extra for value in vars(probe).values()), \
+                "makeRecord kept a reference to the reused extra mapping"
+    extra["extra_fields"] = context
+    try:
+        log_method(logger, message, extra=extra)
+    finally:
+        extra["extra_fields"] = None  # don't keep the context alive
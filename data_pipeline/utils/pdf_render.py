@@ -0,0 +1,66 @@
+"""
+PDF Rendering Module
+
+This module rasterizes PDF pages to numpy arrays for OCR and redaction.
+
+Why a separate module: Rendering needs only pypdfium2 and numpy. Keeping it
+out of the OCR module lets the redactor render pages without importing
+EasyOCR (and torch), and keeps the redaction layer independent of OCR.
+"""
+
+from typing import List, Tuple, Iterator
+from pathlib import Path
+import numpy as np
+import pypdfium2 as pdfium
+
+from config import PipelineConfig
+
+
+def render_pdf_pages(pdf_path: Path, dpi: int = PipelineConfig.PDF_RENDER_DPI) -> List[np.ndarray]:
+    """
+    Rasterize every page of a PDF to a BGR numpy array.
+    
+    Args:
+        pdf_path: Path to PDF file
+        dpi: Render resolution
+        
+    Returns:
+        One image per page
+        
+    Why pdfium: It renders in-process straight into a numpy-compatible
+    buffer. pdf2image forked a Poppler subprocess per PDF and round-tripped
+    every page through an image file. OCR and redaction both use this so
+    bounding boxes line up with the pages being redacted.
+    """
+    _, pages = iter_pdf_pages(pdf_path, dpi)
+    return list(pages)
+
+
+def iter_pdf_pages(
+    pdf_path: Path,
+    dpi: int = PipelineConfig.PDF_RENDER_DPI
+) -> Tuple[int, Iterator[np.ndarray]]:
+    """
+    Open a PDF and rasterize its pages lazily, one at a time.
+    
+    Args:
+        pdf_path: Path to PDF file
+        dpi: Render resolution
+        
+    Returns:
+        Tuple of (page_count, iterator of BGR page images)
+        
+    Why lazy: A caller that finishes with each page before the next (like
+    the redactor) only ever holds one full-resolution page in memory. The
+    document is closed once the iterator is exhausted.
+    """
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    
+    def pages() -> Iterator[np.ndarray]:
+        try:
+            for i in range(len(pdf)):
+                yield pdf[i].render(scale=dpi / 72).to_numpy()
+        finally:
+            pdf.close()
+            
+    return len(pdf), pages()